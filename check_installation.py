@@ -3,23 +3,28 @@
 import importlib
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 
-def check_import(module_name, package_name=None):
-    """Verifica si un módulo puede ser importado"""
+def import_status(module_name, package_name=None):
+    """Intenta importar un módulo y retorna (ok, línea de estado)"""
     try:
         if package_name:
             module = importlib.import_module(module_name, package=package_name)
         else:
             module = importlib.import_module(module_name)
-        print(f"✅ {module_name}")
-        return True
+        return True, f"✅ {module_name}"
     except ImportError as e:
-        print(f"❌ {module_name}: {e}")
-        return False
+        return False, f"❌ {module_name}: {e}"
     except Exception as e:
-        print(f"⚠️  {module_name}: {e}")
-        return False
+        return False, f"⚠️  {module_name}: {e}"
+
+
+def check_import(module_name, package_name=None):
+    """Verifica si un módulo puede ser importado"""
+    ok, line = import_status(module_name, package_name)
+    print(line)
+    return ok
 
 
 def main():
@@ -29,13 +34,19 @@ def main():
     # Verificar dependencias externas
     print("📦 Verificando dependencias externas:")
     external_deps = [
-        "PySide6",
         "requests",
         "psutil",
     ]
 
-    for dep in external_deps:
-        check_import(dep)
+    # PySide6 se importa solo en el hilo principal: inicializa Qt y el resto
+    # de módulos lo comparten
+    check_import("PySide6")
+
+    # requests y psutil no dependen entre sí ni de Qt: se prueban en paralelo
+    # y se imprimen en orden
+    with ThreadPoolExecutor(max_workers=len(external_deps)) as executor:
+        for _, line in executor.map(import_status, external_deps):
+            print(line)
 
     print()
 
@@ -46,6 +57,7 @@ def main():
         ("core.dependency_checker", "core"),
         ("core.state_manager", "core"),
         ("core.application", "core"),
+        ("core._application_impl", "core"),
         ("ui.main_window", "ui"),
         ("ui.components.chat_panel", "ui.components"),
         ("ui.components.side_panel", "ui.components"),
@@ -68,6 +80,8 @@ def main():
         ("utils.constants", "utils"),
     ]
 
+    # Los módulos internos se importan en serie: casi todos cargan PySide6 y
+    # se importan entre sí, y el bloqueo de imports no admite ciclos entre hilos
     all_ok = True
     for module, package in internal_modules:
         if not check_import(module, package):
@@ -2,11 +2,14 @@
 # -*- coding: utf-8 -*-
 
 import os
-import configparser
+import hashlib
 import logging
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
-from datetime import datetime
+from typing import Dict
 import sys
+import time
 
 # --- Definición de Constantes y Configuración ---
 
@@ -34,157 +37,345 @@ PIPER_EXE = "piper-tts"
 KDESU_AVAILABLE = None
 
 # Nuevas constantes para mejoras
-SUPPORTED_LANGUAGES = ['es', 'en', 'fr', 'de', 'it']
+SUPPORTED_LANGUAGES = ('es', 'en', 'fr', 'de', 'it')
+AVAILABLE_THEMES = ('arch-dark', 'arch-light', 'blue-matrix', 'green-terminal', 'purple-haze')
 BACKUP_INTERVAL = 5  # minutos
 
+# --- Directorios del Proyecto ---
+
+_dirs_ready = False
+
+# Directorios ya verificados/creados en este proceso
+_ENSURED = set()
+
+def ensure_dir(path):
+    """Crea un directorio (con sus padres) solo la primera vez que se pide"""
+    if path in _ENSURED:
+        return
+    Path(path).mkdir(parents=True, exist_ok=True)
+    _ENSURED.add(path)
+
+def create_project_directories():
+    """Crea PROJECT_PATH y sus subdirectorios una sola vez por proceso"""
+    global _dirs_ready
+    if _dirs_ready:
+        return
+
+    # Un stat por directorio; mkdir solo para los que faltan
+    for path in (PROJECT_PATH, MODELS_PATH, TEMP_PATH, LOGS_PATH, CONFIGS_PATH):
+        if not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
+
+    _dirs_ready = True
+
 # --- Configuración de Logging ---
 
+# Todos los logs de la sesión comparten el mismo timestamp
+_SESSION_TIMESTAMP = time.strftime('%Y%m%d_%H%M%S')
+
+class _LazyFileHandler(logging.FileHandler):
+    """FileHandler que crea el directorio de logs al abrir el archivo"""
+
+    def _open(self):
+        ensure_dir(os.path.dirname(self.baseFilename))
+        return super()._open()
+
 def setup_logging():
-    """Configura el sistema de logging"""
-    Path(LOGS_PATH).mkdir(parents=True, exist_ok=True)
-
-    log_file = os.path.join(LOGS_PATH, f"arch-chan_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
-
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    """Configura el sistema de logging sin tocar el disco hasta el primer registro"""
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return logging.getLogger("ArchChan")
+
+    log_file = os.path.join(LOGS_PATH, f"arch-chan_{_SESSION_TIMESTAMP}.log")
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    # El archivo (y LOGS_PATH) se crean con el primer registro; desde ahí
+    # cada registro se escribe al momento
+    file_handler = _LazyFileHandler(log_file, encoding='utf-8', delay=True)
+    file_handler.setFormatter(formatter)
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(file_handler)
+    root_logger.addHandler(stream_handler)
     return logging.getLogger("ArchChan")
 
 logger = setup_logging()
 
 # --- Manejo de Configuración ---
 
+# Esquema de configuración: valores por defecto y migraciones. Para migrar
+# una versión anterior basta con añadir aquí la nueva opción.
+SCHEMA = {
+    'General': {
+        'model': 'arch-chan',
+        'auto_cleanup': 'true',
+        'max_history': '20',
+        'notifications': 'true',
+        'voice_enabled': 'true',
+        'theme': 'arch-dark',
+        'language': 'es',
+        'auto_update': 'false',
+        'backup_enabled': 'true'
+    },
+    'Paths': {
+        'project_path': PROJECT_PATH,
+        'models_path': MODELS_PATH,
+        'temp_path': TEMP_PATH,
+        'configs_path': CONFIGS_PATH
+    },
+    'Audio': {
+        'sample_rate': '22050',
+        'silence_threshold': '5%',
+        'voice_volume': '80',
+        'noise_reduction': 'true',
+        'audio_quality': 'high'
+    },
+    'UI': {
+        'window_width': '900',
+        'window_height': '700',
+        'sidebar_visible': 'true',
+        'font_size': '11',
+        'animations': 'true',
+        'compact_mode': 'false'
+    },
+    'Advanced': {
+        'timeout_duration': '120',
+        'max_response_length': '4000',
+        'retry_attempts': '3',
+        'cache_responses': 'true'
+    }
+}
+
+# Valores cortos (true/false, nombres de tema, números...) se repiten mucho
+_INTERN_MAX_LEN = 16
+
+def _intern_value(value):
+    """Interna valores cortos para compartir un único objeto str"""
+    return sys.intern(value) if len(value) < _INTERN_MAX_LEN else value
+
+SCHEMA = {
+    sys.intern(section): {sys.intern(k): _intern_value(v) for k, v in options.items()}
+    for section, options in SCHEMA.items()
+}
+
+_TRUE_VALUES = ('true', '1', 'yes', 'on')
+
+# Opciones que se convierten a bool/int una sola vez al cargar
+_BOOL_KEYS = frozenset({
+    ('General', 'auto_cleanup'),
+    ('General', 'notifications'),
+    ('General', 'voice_enabled'),
+    ('General', 'auto_update'),
+    ('General', 'backup_enabled'),
+    ('Audio', 'noise_reduction'),
+    ('UI', 'sidebar_visible'),
+    ('UI', 'animations'),
+    ('UI', 'compact_mode'),
+    ('Advanced', 'cache_responses'),
+})
+_INT_KEYS = frozenset({
+    ('General', 'max_history'),
+    ('Audio', 'sample_rate'),
+    ('Audio', 'voice_volume'),
+    ('UI', 'window_width'),
+    ('UI', 'window_height'),
+    ('UI', 'font_size'),
+    ('Advanced', 'timeout_duration'),
+    ('Advanced', 'max_response_length'),
+    ('Advanced', 'retry_attempts'),
+})
+
+@dataclass
+class _RawConfig:
+    """Configuración ya parseada: {sección: {opción: valor}}"""
+    sections: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+# Una sola expresión reconoce "[sección]", "clave = valor" y "clave: valor";
+# las líneas vacías y los comentarios no hacen match. Como en configparser,
+# separa el primer "=" o ":" y no hay comentarios en línea ("#" puede formar
+# parte de un valor).
+_INI_RE = re.compile(
+    rb'\s*(?:\[(?P<sec>[^\]]+)\]'
+    rb'|(?P<key>[^=:;#\s][^=:]*?)\s*[=:]\s*(?P<val>.*?))\s*$'
+)
+
+def _parse_ini(data):
+    """Parsea el contenido de un INI en una sola pasada"""
+    sections = {}
+    current = None
+    match = _INI_RE.match
+    for line in data.splitlines():
+        m = match(line)
+        if m is None:
+            continue
+        sec = m.group('sec')
+        if sec is not None:
+            current = sections.setdefault(sys.intern(sec.strip().decode('utf-8')), {})
+        elif current is not None:
+            key = sys.intern(m.group('key').decode('utf-8').lower())
+            current[key] = _intern_value(m.group('val').decode('utf-8'))
+    return sections
+
 class ConfigManager:
     """Gestiona la configuración persistente de la aplicación"""
 
     def __init__(self):
-        self.config = configparser.ConfigParser()
+        self.config = _RawConfig()
         self.config_file = CONFIG_FILE
+        self.values = {}
+        self._dirty = False
+        self._last_backup_hash = None
+        self._last_backup_t = None
 
     def load_config(self):
         """Carga la configuración desde archivo o crea una por defecto"""
-        defaults = {
-            'General': {
-                'model': 'arch-chan',
-                'auto_cleanup': 'true',
-                'max_history': '20',
-                'notifications': 'true',
-                'voice_enabled': 'true',
-                'theme': 'arch-dark',
-                'language': 'es',
-                'auto_update': 'false',
-                'backup_enabled': 'true'
-            },
-            'Paths': {
-                'project_path': PROJECT_PATH,
-                'models_path': MODELS_PATH,
-                'temp_path': TEMP_PATH,
-                'configs_path': CONFIGS_PATH
-            },
-            'Audio': {
-                'sample_rate': '22050',
-                'silence_threshold': '5%',
-                'voice_volume': '80',
-                'noise_reduction': 'true',
-                'audio_quality': 'high'
-            },
-            'UI': {
-                'window_width': '900',
-                'window_height': '700',
-                'sidebar_visible': 'true',
-                'font_size': '11',
-                'animations': 'true',
-                'compact_mode': 'false'
-            },
-            'Advanced': {
-                'timeout_duration': '120',
-                'max_response_length': '4000',
-                'retry_attempts': '3',
-                'cache_responses': 'true'
-            }
-        }
-
         # Crear directorios si no existen
-        for path in [PROJECT_PATH, MODELS_PATH, TEMP_PATH, LOGS_PATH, CONFIGS_PATH]:
-            Path(path).mkdir(parents=True, exist_ok=True)
+        create_project_directories()
 
-        if os.path.exists(self.config_file):
-            self.config.read(self.config_file, encoding='utf-8')
-            
-            # Migrar configuraciones antiguas
-            self.migrate_old_config()
-        else:
-            self.config.read_dict(defaults)
+        # EAFP: abrir directamente en lugar de comprobar antes si existe
+        try:
+            with open(self.config_file, 'rb') as f:
+                raw = _parse_ini(f.read())
+        except FileNotFoundError:
+            raw = {}
+
+        # Aplicar valores por defecto y migraciones en una sola pasada
+        self._dirty = False
+        for section, options in SCHEMA.items():
+            current = raw.setdefault(section, {})
+            for option, value in options.items():
+                if option not in current:
+                    current[option] = value
+                    self._dirty = True
+
+        self.config.sections = raw
+        self._refresh_values()
+        if self._dirty:
             self.save_config()
 
         return self.config
 
-    def migrate_old_config(self):
-        """Migra configuraciones de versiones anteriores"""
-        # Migrar sección UI si no existe
-        if not self.config.has_section('UI'):
-            self.config.add_section('UI')
-            self.config.set('UI', 'theme', 'arch-dark')
-            self.config.set('UI', 'sidebar_visible', 'true')
-            self.config.set('UI', 'font_size', '11')
-            self.config.set('UI', 'animations', 'true')
-            self.config.set('UI', 'compact_mode', 'false')
-        
-        # Migrar sección Advanced si no existe
-        if not self.config.has_section('Advanced'):
-            self.config.add_section('Advanced')
-            self.config.set('Advanced', 'timeout_duration', '120')
-            self.config.set('Advanced', 'max_response_length', '4000')
-            self.config.set('Advanced', 'retry_attempts', '3')
-            self.config.set('Advanced', 'cache_responses', 'true')
-        
-        # Migrar nuevas opciones de General
-        if not self.config.has_option('General', 'language'):
-            self.config.set('General', 'language', 'es')
-        if not self.config.has_option('General', 'auto_update'):
-            self.config.set('General', 'auto_update', 'false')
-        if not self.config.has_option('General', 'backup_enabled'):
-            self.config.set('General', 'backup_enabled', 'true')
-            
-        # Migrar nuevas opciones de Audio
-        if not self.config.has_option('Audio', 'noise_reduction'):
-            self.config.set('Audio', 'noise_reduction', 'true')
-        if not self.config.has_option('Audio', 'audio_quality'):
-            self.config.set('Audio', 'audio_quality', 'high')
-            
-        self.save_config()
+    def get(self, section, option, fallback=None):
+        """Retorna el valor de una opción o `fallback` si no existe"""
+        return self.config.sections.get(section, {}).get(option.lower(), fallback)
+
+    def getboolean(self, section, option, fallback=False):
+        """Retorna una opción interpretada como booleano"""
+        value = self.values.get((section, option.lower()))
+        if value is None:
+            return fallback
+        if isinstance(value, bool):
+            return value
+        return str(value).lower() in _TRUE_VALUES
+
+    def set(self, section, option, value):
+        """Establece una opción y marca la configuración como modificada"""
+        options = self.config.sections.setdefault(section, {})
+        option = option.lower()
+        value = str(value)
+        if options.get(option) != value:
+            options[option] = value
+            self._dirty = True
+            self._refresh_values()
+
+    def _refresh_values(self):
+        """Precalcula la vista tipada {(sección, opción): valor}"""
+        values = {}
+        for section, options in self.config.sections.items():
+            for option, raw in options.items():
+                key = (section, option)
+                if key in _BOOL_KEYS:
+                    values[key] = raw.lower() in _TRUE_VALUES
+                elif key in _INT_KEYS:
+                    try:
+                        values[key] = int(raw)
+                    except ValueError:
+                        continue
+                else:
+                    values[key] = raw
+        self.values = values
+
+    def _serialize(self):
+        """Serializa la configuración en formato INI con un único join"""
+        parts = []
+        for section, options in self.config.sections.items():
+            parts.append(f'[{section}]\n')
+            parts.extend(f'{option} = {value}\n' for option, value in options.items())
+            parts.append('\n')
+        return ''.join(parts)
 
     def save_config(self):
-        """Guarda la configuración actual"""
+        """Guarda la configuración actual si hubo cambios"""
+        if not self._dirty:
+            return
+
         try:
-            # Crear backup antes de guardar
-            if self.config.getboolean('General', 'backup_enabled', fallback=True):
-                self.create_config_backup()
+            # Serializar una sola vez para el backup y el archivo principal
+            data = self._serialize()
+
+            # Crear backup antes de guardar (si aún no existe el archivo,
+            # no hay nada que respaldar)
+            if (
+                self.values.get(('General', 'backup_enabled'), True)
+                and os.path.exists(self.config_file)
+            ):
+                self.create_config_backup(data)
                 
             with open(self.config_file, 'w', encoding='utf-8') as f:
-                self.config.write(f)
+                f.write(data)
+            self._dirty = False
+            self._refresh_values()
             logger.info("Configuración guardada correctamente")
         except Exception as e:
             logger.error(f"Error guardando configuración: {e}")
 
-    def create_config_backup(self):
-        """Crea un backup de la configuración"""
+    def create_config_backup(self, data=None):
+        """Crea un backup de la configuración si su contenido cambió"""
+        # Como mucho un backup cada BACKUP_INTERVAL minutos
+        if (
+            self._last_backup_t is not None
+            and time.monotonic() - self._last_backup_t < BACKUP_INTERVAL * 60
+        ):
+            return
+
         try:
+            if data is None:
+                data = self._serialize()
+            digest = hashlib.blake2b(data.encode('utf-8'), digest_size=8).hexdigest()
+
             backup_dir = os.path.join(CONFIGS_PATH, "backups")
-            Path(backup_dir).mkdir(parents=True, exist_ok=True)
+            hash_file = os.path.join(backup_dir, "last_backup.hash")
+
+            # Recuperar el hash del último backup de sesiones anteriores
+            if self._last_backup_hash is None:
+                try:
+                    with open(hash_file, 'r', encoding='utf-8') as f:
+                        self._last_backup_hash = f.read().strip()
+                except OSError:
+                    self._last_backup_hash = ''
+
+            if digest == self._last_backup_hash:
+                return
+
+            ensure_dir(backup_dir)
             
             backup_file = os.path.join(
                 backup_dir, 
-                f"config_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ini"
+                f"config_backup_{time.strftime('%Y%m%d_%H%M%S')}.ini"
             )
             
-            with open(backup_file, 'w', encoding='utf-8') as f:
-                self.config.write(f)
+            tmp_file = backup_file + '.tmp'
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_file, backup_file)
+
+            with open(hash_file, 'w', encoding='utf-8') as f:
+                f.write(digest)
+            self._last_backup_hash = digest
+            self._last_backup_t = time.monotonic()
                 
             logger.info(f"Backup de configuración creado: {backup_file}")
         except Exception as e:
@@ -192,7 +383,7 @@ class ConfigManager:
 
     def get_available_themes(self):
         """Retorna la lista de temas disponibles"""
-        return ['arch-dark', 'arch-light', 'blue-matrix', 'green-terminal', 'purple-haze']
+        return AVAILABLE_THEMES
 
     def get_available_languages(self):
         """Retorna la lista de idiomas disponibles"""
@@ -215,14 +406,3 @@ class DependencyError(Exception):
 class ModelNotFoundError(Exception):
     """Excepción para modelos no encontrados"""
     pass
-
-# --- Estados de la Aplicación ---
-
-class AppState:
-    """Define los estados posibles de la aplicación"""
-    IDLE = "idle"
-    LISTENING = "listening"
-    PROCESSING = "processing"
-    SPEAKING = "speaking"
-    ERROR = "error"
-    UPDATING = "updating"
\ No newline at end of file
@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Núcleo de la aplicación.
+
+Las clases públicas se importan bajo demanda: ``import core`` no carga Qt
+ni ninguno de los submódulos hasta que se accede a ellas.
+"""
+
+import importlib
+
+# Nombre público -> submódulo que lo define
+_LAZY_ATTRS = {
+    "ArchChanApplication": ".application",
+    "ConfigManager": ".config_manager",
+    "AppState": ".state_manager",
+    "AppStateManager": ".state_manager",
+    "DependencyChecker": ".dependency_checker",
+    "DependencyError": ".dependency_checker",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
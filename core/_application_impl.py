@@ -0,0 +1,571 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import hashlib
+import importlib
+import json
+import os
+import shutil
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from PySide6.QtCore import QObject, Qt, QThread, Signal
+
+from config import create_project_directories
+from core.config_manager import ConfigManager
+from core.state_manager import AppState, AppStateManager
+from utils.constants import APP_VERSION, CONFIGS_PATH
+from utils.logger import get_logger
+
+# Los widgets Qt, la UI y los servicios se importan dentro de los métodos que
+# los usan; aquí solo se necesitan para anotaciones
+if TYPE_CHECKING:
+    from services.ollama_client import OllamaClient
+    from services.system_monitor import SystemMonitor
+    from ui.main_window import MainWindow
+
+
+# Marcador de la última verificación de dependencias exitosa
+DEPS_MARKER_FILE = Path(CONFIGS_PATH) / ".deps_ok"
+
+# Herramientas cuya instalación/actualización invalida el marcador
+_DEPS_SIGNATURE_TOOLS = ("whisper-cli", "piper-tts", "kdesu")
+
+
+class ArchChanApplication(QObject):
+    """Clase principal de la aplicación que coordina todos los módulos"""
+
+    # Señales de la aplicación
+    app_initialized = Signal()
+    app_shutdown = Signal()
+    error_occurred = Signal(str)
+    status_changed = Signal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.logger = get_logger("ArchChanApplication")
+
+        # Componentes principales
+        self.config_manager: Optional[ConfigManager] = None
+        self.state_manager: Optional[AppStateManager] = None
+        self.main_window: Optional["MainWindow"] = None
+        self.system_monitor: Optional["SystemMonitor"] = None
+        self.ollama_client: Optional["OllamaClient"] = None
+
+        # Hilos
+        self.system_monitor_thread: Optional[QThread] = None
+
+        # Datos
+        self.available_models: List[Dict[str, Any]] = []
+
+        # Estado de la aplicación
+        self._is_initialized = False
+        self._shutdown_requested = False
+        self._last_error: Optional[str] = None
+
+        self.logger.info("ArchChanApplication instanciada")
+
+    def start(self) -> bool:
+        """
+        Inicializa y arranca la aplicación
+
+        Returns:
+            True si la inicialización fue exitosa
+        """
+        try:
+            self.logger.info("Iniciando Arch-Chan AI Assistant v2.1.0...")
+
+            # 1. Inicializar componentes core PRIMERO
+            if not self._initialize_core_components():
+                return False
+
+            # 2. Verificar dependencias mientras se diagnostica Ollama: ambas
+            #    tareas son independientes y están dominadas por I/O. En
+            #    paralelo se precarga el módulo de la ventana principal, que
+            #    también importa services.ollama_client: el cliente se crea
+            #    antes, en este hilo, para no importar el módulo a la vez
+            with ThreadPoolExecutor(
+                max_workers=3, thread_name_prefix="archchan-startup"
+            ) as executor:
+                diagnostic_future = self._start_ollama_diagnostic(executor)
+                executor.submit(self._preload_main_window)
+                deps_future = executor.submit(self._run_dependency_check)
+                if not self._check_dependencies(deps_future):
+                    return False
+
+            # 3. Inicializar servicios
+            if not self._initialize_services(diagnostic_future):
+                return False
+
+            # 4. Inicializar UI
+            if not self._initialize_ui():
+                return False
+
+            # 5. Conectar señales
+            self._connect_signals()
+
+            # 6. Verificar estado final
+            if not self._finalize_initialization():
+                return False
+
+            self._is_initialized = True
+            if self.state_manager:
+                self.state_manager.set_idle("Aplicación lista")
+            self.logger.info("Aplicación inicializada correctamente")
+            self.app_initialized.emit()
+
+            return True
+
+        except Exception as e:
+            error_msg = f"Error durante el inicio: {str(e)}"
+            self.logger.error(error_msg, exc_info=True)
+            self._handle_error(error_msg, "Error de inicialización")
+            return False
+
+    def _initialize_core_components(self) -> bool:
+        """Inicializa los componentes core de la aplicación"""
+        try:
+            self.logger.info("Inicializando componentes core...")
+
+            # Inicializar state_manager PRIMERO para poder usarlo
+            self.state_manager = AppStateManager()
+            self.logger.info("AppStateManager inicializado")
+
+            # Configuración
+            self.config_manager = ConfigManager()
+            self.logger.info("ConfigManager inicializado")
+
+            # Crear directorios necesarios
+            self._create_application_directories()
+
+            # Ahora podemos usar state_manager para establecer estado
+            if self.state_manager:
+                self.state_manager.set_starting("Inicializando componentes core...")
+
+            return True
+
+        except Exception as e:
+            error_msg = f"Error inicializando componentes core: {str(e)}"
+            self.logger.error(error_msg)
+            self._handle_error(error_msg, "Error de componentes core")
+            return False
+
+    def _create_application_directories(self):
+        """Crea los directorios necesarios para la aplicación"""
+        self.logger.info("Creando directorios de la aplicación...")
+
+        # Compartido con config/constants: solo crea los directorios una vez
+        try:
+            create_project_directories()
+        except OSError as e:
+            self.logger.error(
+                f"Error creando directorio de la aplicación {e.filename}: {e.strerror}"
+            )
+
+    def _run_dependency_check(self) -> Optional[Dict[str, bool]]:
+        """
+        Ejecuta la verificación de dependencias (apto para un hilo secundario)
+
+        Returns:
+            Requisitos del sistema, o None si se reutilizó una verificación previa
+        """
+        from core.dependency_checker import DependencyChecker
+
+        signature = self._dependency_signature()
+        if self._deps_marker_valid(signature):
+            return None
+
+        checker = DependencyChecker()
+        checker.check_all_dependencies()
+        requirements = checker.check_system_requirements()
+
+        self._write_deps_marker(signature)
+        return requirements
+
+    def _check_dependencies(self, deps_future: Optional[Future] = None) -> bool:
+        """Verifica las dependencias del sistema"""
+        from core.dependency_checker import DependencyError
+
+        try:
+            self.logger.info("Verificando dependencias del sistema...")
+            if self.state_manager:
+                self.state_manager.set_status_message("Verificando dependencias...")
+
+            if deps_future is not None:
+                requirements = deps_future.result()
+            else:
+                requirements = self._run_dependency_check()
+
+            if requirements is None:
+                self.logger.info(
+                    "Dependencias verificadas en un arranque anterior, omitiendo comprobación"
+                )
+                return True
+
+            # Verificar requisitos del sistema
+            for req, met in requirements.items():
+                if not met:
+                    self.logger.warning(f"Requisito no cumplido: {req}")
+
+            self.logger.info("Todas las dependencias verificadas correctamente")
+            return True
+
+        except DependencyError as e:
+            error_msg = f"Dependencias faltantes: {str(e)}"
+            self.logger.error(error_msg)
+            self._handle_error(error_msg, "Dependencias faltantes")
+
+            # Mostrar diálogo de error
+            self._show_error_dialog(
+                "Dependencias Faltantes",
+                f"Faltan las siguientes dependencias:\n\n{str(e)}\n\n"
+                "Por favor, instala las dependencias necesarias y reinicia la aplicación.",
+            )
+            return False
+
+        except Exception as e:
+            error_msg = f"Error verificando dependencias: {str(e)}"
+            self.logger.error(error_msg)
+            self._handle_error(error_msg, "Error de dependencias")
+            return False
+
+    def _dependency_signature(self) -> str:
+        """Firma de las herramientas críticas (ruta + mtime de cada una)"""
+        parts = []
+        for command in _DEPS_SIGNATURE_TOOLS:
+            path = shutil.which(command)
+            try:
+                mtime = os.stat(path).st_mtime_ns if path else None
+            except OSError:
+                mtime = None
+            parts.append(f"{command}={path}:{mtime}")
+        return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+    def _deps_marker_valid(self, signature: str) -> bool:
+        """Verifica si el marcador corresponde a esta versión y firma"""
+        try:
+            with open(DEPS_MARKER_FILE, "r", encoding="utf-8") as f:
+                marker = json.load(f)
+        except (OSError, ValueError):
+            return False
+        return marker.get("version") == APP_VERSION and marker.get("sig") == signature
+
+    def _write_deps_marker(self, signature: str):
+        """Guarda el marcador de verificación de dependencias exitosa"""
+        try:
+            with open(DEPS_MARKER_FILE, "w", encoding="utf-8") as f:
+                json.dump({"version": APP_VERSION, "sig": signature}, f)
+        except OSError as e:
+            self.logger.debug(f"No se pudo guardar el marcador de dependencias: {e}")
+
+    def _preload_main_window(self):
+        """Importa ui.main_window en segundo plano sin crear ningún widget"""
+        try:
+            importlib.import_module("ui.main_window")
+        except Exception as e:
+            # _initialize_ui repetirá la importación y reportará el error
+            self.logger.debug(f"No se pudo precargar la ventana principal: {e}")
+
+    def _start_ollama_diagnostic(
+        self, executor: ThreadPoolExecutor
+    ) -> Optional[Future]:
+        """Crea el cliente de Ollama y lanza su diagnóstico en segundo plano"""
+        # El QObject se crea en el hilo principal; solo el diagnóstico
+        # (peticiones HTTP) se ejecuta en el hilo de trabajo
+        try:
+            from services.ollama_client import OllamaClient
+
+            self.ollama_client = OllamaClient()
+            return executor.submit(self.ollama_client.diagnostic_check)
+        except Exception as e:
+            self.logger.error(f"Error creando cliente de Ollama: {str(e)}")
+            return None
+
+    def _initialize_services(self, diagnostic_future: Optional[Future] = None) -> bool:
+        """Inicializa los servicios en segundo plano"""
+        try:
+            self.logger.info("Inicializando servicios...")
+            if self.state_manager:
+                self.state_manager.set_status_message("Inicializando servicios...")
+
+            # Cliente Ollama con diagnóstico mejorado
+            if self.ollama_client is None:
+                from services.ollama_client import OllamaClient
+
+                self.ollama_client = OllamaClient()
+
+            # Realizar diagnóstico primero (normalmente ya lanzado en paralelo)
+            if diagnostic_future is not None:
+                diagnostic = diagnostic_future.result()
+            else:
+                diagnostic = self.ollama_client.diagnostic_check()
+            self.logger.info(f"Diagnóstico de Ollama: {diagnostic}")
+
+            if not diagnostic["api_health"]:
+                self.logger.warning(
+                    "Ollama no está disponible, continuando en modo offline"
+                )
+                self.available_models = []
+            else:
+                self.logger.info("OllamaClient inicializado correctamente")
+                # Cargar modelos disponibles
+                self.available_models = self.ollama_client.list_models() or []
+                if self.available_models:
+                    self.logger.info(
+                        f"Modelos disponibles: {len(self.available_models)}"
+                    )
+                else:
+                    self.logger.warning("No se encontraron modelos en Ollama")
+                    self.available_models = []
+
+            # Monitoreo del sistema (Patrón moveToThread)
+            from services.system_monitor import SystemMonitor
+
+            self.system_monitor = SystemMonitor()
+            self.system_monitor_thread = QThread()
+            self.system_monitor.moveToThread(self.system_monitor_thread)
+
+            # Conectar señales del hilo
+            self.system_monitor_thread.started.connect(self.system_monitor.run)
+            self.system_monitor.finished.connect(self.system_monitor_thread.quit)
+            self.system_monitor.finished.connect(self.system_monitor.deleteLater)
+            self.system_monitor_thread.finished.connect(
+                self.system_monitor_thread.deleteLater
+            )
+
+            # Iniciar hilo
+            self.system_monitor_thread.start()
+            self.logger.info("SystemMonitor inicializado y movido a hilo")
+
+            return True
+
+        except Exception as e:
+            error_msg = f"Error inicializando servicios: {str(e)}"
+            self.logger.error(error_msg)
+            self._handle_error(error_msg, "Error de servicios")
+            return False
+
+    def _initialize_ui(self) -> bool:
+        """Inicializa la interfaz de usuario"""
+        from PySide6.QtWidgets import QApplication
+
+        from ui.main_window import MainWindow
+
+        try:
+            self.logger.info("Inicializando interfaz de usuario...")
+            if self.state_manager:
+                self.state_manager.set_status_message("Inicializando interfaz...")
+
+            app = QApplication.instance()
+            if not app:
+                self.logger.error("No se encontró instancia de QApplication")
+                return False
+
+            self.main_window = MainWindow(
+                config_manager=self.config_manager, state_manager=self.state_manager
+            )
+
+            if self.ollama_client:
+                self.main_window.set_ollama_client(self.ollama_client)
+
+            if hasattr(self.main_window, "set_available_models"):
+                self.main_window.set_available_models(self.available_models)
+
+            self.main_window.show()
+            self.logger.info("Interfaz de usuario inicializada correctamente")
+            return True
+
+        except Exception as e:
+            error_msg = f"Error inicializando interfaz de usuario: {str(e)}"
+            self.logger.error(error_msg, exc_info=True)
+            self._handle_error(error_msg, "Error de interfaz")
+            return False
+
+    def _connect_signals(self):
+        """Conecta las señales entre componentes"""
+        try:
+            self.logger.info("Conectando señales entre componentes...")
+
+            # Emisor y receptor viven en el hilo principal: conexión directa,
+            # sin pasar por la cola de eventos
+            if self.state_manager:
+                self.state_manager.state_changed.connect(
+                    self._on_state_changed, Qt.DirectConnection
+                )
+                self.state_manager.error_occurred.connect(
+                    self._on_error_occurred, Qt.DirectConnection
+                )
+
+            if self.main_window:
+                self.main_window.shutdown_requested.connect(self.shutdown)
+
+                side_panel = getattr(self.main_window, "side_panel", None)
+                status_bar = getattr(self.main_window, "status_bar", None)
+
+                # Conectar SystemMonitor al SidePanel
+                if self.system_monitor and side_panel:
+                    self.system_monitor.system_updated.connect(
+                        side_panel.update_system_info
+                    )
+
+                    self.system_monitor.health_status_changed.connect(
+                        side_panel.update_health_status
+                    )
+
+                    self.logger.info("SystemMonitor conectado al SidePanel")
+
+                # Conectar SystemMonitor al StatusBar
+                if self.system_monitor and status_bar:
+                    self.system_monitor.system_updated.connect(
+                        status_bar.update_performance_metrics
+                    )
+
+                    # service="Ollama" es el valor por defecto: no hace falta lambda
+                    self.system_monitor.ollama_status_changed.connect(
+                        status_bar.update_connection_status
+                    )
+
+                    self.logger.info("SystemMonitor conectado al StatusBar")
+
+            self.error_occurred.connect(self._on_global_error, Qt.DirectConnection)
+            self.logger.info("Todas las señales conectadas correctamente")
+
+        except Exception as e:
+            self.logger.error(f"Error conectando señales: {str(e)}")
+
+    def _finalize_initialization(self) -> bool:
+        """Completa la inicialización de la aplicación"""
+        try:
+            self.logger.info("Finalizando inicialización...")
+            if self.state_manager:
+                self.state_manager.set_status_message("Finalizando inicialización...")
+
+            components_ready = all(
+                [
+                    self.config_manager is not None,
+                    self.state_manager is not None,
+                    self.main_window is not None,
+                ]
+            )
+
+            if not components_ready:
+                self.logger.error(
+                    "No todos los componentes se inicializaron correctamente"
+                )
+                return False
+
+            self.logger.info("Inicialización completada correctamente")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Error finalizando inicialización: {str(e)}")
+            return False
+
+    def _on_state_changed(self, old_state: AppState, new_state: AppState):
+        """Maneja cambios de estado"""
+        if old_state == new_state:
+            return
+        self.logger.debug(f"Estado cambiado: {old_state.value} -> {new_state.value}")
+        # Propagar cambio de estado a la ventana principal
+        if self.main_window:
+            self.main_window._on_state_changed(old_state.value, new_state.value)
+
+    def _on_error_occurred(self, error_message: str):
+        """Maneja errores del estado manager"""
+        self.logger.error(f"Error del estado manager: {error_message}")
+        self._show_error_dialog("Error de Aplicación", error_message)
+
+    def _on_global_error(self, error_message: str):
+        """Maneja errores globales"""
+        # El mismo error repetido ya se registró y notificó
+        if error_message == self._last_error:
+            return
+        self._last_error = error_message
+        self.logger.error(f"Error global: {error_message}")
+        self._handle_error(error_message, "Error global")
+
+    def _handle_error(self, error_message: str, context: str = ""):
+        """Maneja errores de forma segura, incluso si state_manager no está disponible"""
+        try:
+            self.logger.error(f"Error ({context}): {error_message}")
+            if self.state_manager:
+                self.state_manager.set_error(error_message, context)
+            else:
+                self.error_occurred.emit(error_message)
+        except Exception as e:
+            self.logger.error(f"Error crítico en manejo de errores: {str(e)}")
+            self.logger.error(f"Error original ({context}): {error_message}")
+
+    def _show_error_dialog(self, title: str, message: str):
+        """Muestra un diálogo de error"""
+        try:
+            from PySide6.QtWidgets import QApplication
+
+            # Sin QApplication no se puede mostrar nada: solo log y stderr
+            if QApplication.instance() is None:
+                self.logger.error(f"[sin UI] {title}: {message}")
+                print(f"{title}: {message}", file=sys.stderr)
+                return
+
+            from PySide6.QtWidgets import QMessageBox
+
+            QMessageBox.critical(None, title, message)
+        except Exception as e:
+            self.logger.error(f"Error mostrando diálogo: {str(e)}")
+
+    def shutdown(self):
+        """Apaga la aplicación de forma ordenada"""
+        if self._shutdown_requested:
+            return
+        self._shutdown_requested = True
+        self.logger.info("Iniciando apagado ordenado de la aplicación...")
+
+        if self.state_manager:
+            self.state_manager.set_shutting_down("Apagando aplicación...")
+
+        self.app_shutdown.emit()
+
+        try:
+            # Detener servicios
+            if self.system_monitor:
+                self.system_monitor.stop()
+            if self.system_monitor_thread:
+                self.system_monitor_thread.quit()
+                self.system_monitor_thread.wait(2000)
+
+            # Guardar configuración
+            if self.config_manager:
+                self.config_manager.save_config()
+
+            # Cerrar ventana principal (ya se maneja por el evento close)
+            if self.main_window:
+                self.main_window.close()
+
+            self.logger.info("Aplicación cerrada correctamente")
+
+        except Exception as e:
+            self.logger.error(f"Error durante el apagado: {str(e)}")
+
+    def restart(self):
+        """Reinicia la aplicación"""
+        from PySide6.QtCore import QTimer
+
+        self.logger.info("Reiniciando aplicación...")
+        self.shutdown()
+        QTimer.singleShot(1000, self._perform_restart)
+
+    def _perform_restart(self):
+        """Ejecuta el reinicio de la aplicación"""
+        try:
+            python = sys.executable
+            os.execl(python, python, *sys.argv)
+        except Exception as e:
+            self.logger.error(f"Error reiniciando aplicación: {str(e)}")
+            # Intentar reiniciar sin execl
+            self.start()
+
+    def is_initialized(self) -> bool:
+        """Verifica si la aplicación está inicializada"""
+        return self._is_initialized
@@ -1,11 +1,13 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import configparser
+import hashlib
+import heapq
 import os
-from datetime import datetime
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Sequence
 
 from utils.constants import (
     CONFIG_FILE,
@@ -17,109 +19,336 @@ from utils.constants import (
 )
 from utils.logger import get_logger
 
+# Tamaño del búfer de lectura del archivo de configuración
+_READ_BUFFER_SIZE = 65536
+
+# Sección cuyas opciones heredan todas las demás, como en ConfigParser
+_DEFAULT_SECTION = "DEFAULT"
+
+# Mismos valores que acepta ConfigParser.getboolean
+_BOOLEAN_STATES = {
+    "1": True,
+    "yes": True,
+    "true": True,
+    "on": True,
+    "0": False,
+    "no": False,
+    "false": False,
+    "off": False,
+}
+
+# Configuraciones ya leídas y validadas, por (ruta, mtime_ns, tamaño):
+# evita repetir lectura y validación mientras el archivo no cambie
+_PARSED_CONFIG_CACHE: Dict[tuple, tuple] = {}
+_PARSED_CONFIG_LOCK = threading.Lock()
+
+# Opciones que deben contener enteros, como pares (sección, opción)
+_INT_FIELDS = frozenset(
+    {
+        ("General", "max_history"),
+        ("UI", "window_width"),
+        ("UI", "window_height"),
+        ("UI", "font_size"),
+        ("Audio", "sample_rate"),
+        ("Audio", "voice_volume"),
+        ("Advanced", "timeout_duration"),
+        ("Advanced", "max_response_length"),
+        ("Advanced", "retry_attempts"),
+    }
+)
+
+# Centinela para distinguir "no está en caché" de un valor falso
+_MISS = object()
+
+# Valores por defecto que no dependen de las rutas del usuario
+_DEFAULT_CONFIG_STATIC: Dict[str, Dict[str, str]] = {
+    "General": {
+        "model": "arch-chan",
+        "auto_cleanup": "true",
+        "max_history": "20",
+        "notifications": "true",
+        "language": "es",
+        "auto_update": "false",
+        "backup_enabled": "true",
+        "startup_minimized": "false",
+    },
+    "Audio": {
+        "voice_enabled": "true",
+        "sample_rate": "22050",
+        "silence_threshold": "5%",
+        "voice_volume": "80",
+        "noise_reduction": "true",
+        "audio_quality": "high",
+        "input_device": "",
+        "output_device": "",
+    },
+    "UI": {
+        "theme": "arch-dark",
+        "window_width": "900",
+        "window_height": "700",
+        "sidebar_visible": "true",
+        "font_size": "11",
+        "animations": "true",
+        "compact_mode": "false",
+        "tray_enabled": "true",
+        "always_on_top": "false",
+    },
+    "Advanced": {
+        "timeout_duration": "120",
+        "max_response_length": "4000",
+        "retry_attempts": "3",
+        "cache_responses": "true",
+        "sudo_confirm": "true",
+        "block_dangerous": "true",
+        "debug_mode": "false",
+        "log_level": "INFO",
+    },
+}
+
+# Idiomas disponibles en la interfaz
+_AVAILABLE_LANGUAGES = ("es", "en", "fr", "de", "it", "pt", "ru", "ja", "zh")
+
 
 class ConfigManager:
     """Gestiona la configuración persistente de la aplicación"""
 
+    __slots__ = (
+        "logger",
+        "_data",
+        "_defaults",
+        "_last_saved_hash",
+        "_flat",
+        "_dirty",
+        "_loaded",
+        "project_path",
+        "models_path",
+        "temp_path",
+        "logs_path",
+        "configs_path",
+        "config_file",
+    )
+
     def __init__(self, config_path: Optional[str] = None):
         self.logger = get_logger("ConfigManager")
-        self.config = configparser.ConfigParser()
-
-        # Usar rutas de constants.py - asegurar que son Path objects
-        self.project_path = Path(PROJECT_DIR)
-        self.models_path = Path(MODELS_DIR)
-        self.temp_path = Path(TEMP_DIR)
-        self.logs_path = Path(LOGS_DIR)
+        # Secciones -> opciones -> valores (config retorna una copia como ConfigParser)
+        self._data: Dict[str, Dict[str, str]] = {}
+        self._defaults: Optional[Dict[str, Dict[str, str]]] = None
+        # Huella del contenido guardado en disco (evita escrituras sin cambios)
+        self._last_saved_hash: Optional[str] = None
+        # Vista plana: (sección, opción) -> valor y (sección, opción, tipo) ->
+        # valor ya convertido por getboolean/getint/getfloat
+        self._flat: Dict[tuple, Any] = {}
+        # Cambios en memoria pendientes de guardar
+        self._dirty = False
+        # El archivo se lee en el primer acceso, no al construir
+        self._loaded = False
+
+        # Rutas de constants.py: ya son Path compuestos desde PROJECT_DIR
+        self.project_path = PROJECT_DIR
+        self.models_path = MODELS_DIR
+        self.temp_path = TEMP_DIR
+        self.logs_path = LOGS_DIR
         self.configs_path = (
-            Path(CONFIGS_PATH) if CONFIGS_PATH else self.project_path / "config"
+            Path(CONFIGS_PATH) if CONFIGS_PATH else PROJECT_DIR / "config"
         )
 
         # Usar ruta personalizada o la por defecto
-        if config_path:
-            self.config_file = Path(config_path)
-        else:
-            self.config_file = Path(CONFIG_FILE)
+        self.config_file = Path(config_path) if config_path else CONFIG_FILE
 
-        # Cargar configuración al inicializar
-        self.load_config()
+    @property
+    def config(self):
+        """Copia de solo lectura de la configuración como ConfigParser
 
-    def load_config(self) -> configparser.ConfigParser:
+        Los cambios hechos sobre la copia no se aplican: para modificar la
+        configuración hay que usar set().
+        """
+        if not self._loaded:
+            self.load_config()
+        import configparser
+
+        parser = configparser.ConfigParser(interpolation=None)
+        parser.read_dict(self._data)
+        return parser
+
+    def load_config(self) -> Dict[str, Dict[str, str]]:
         """Carga la configuración desde archivo o crea una por defecto"""
         self.logger.info("Cargando configuración...")
+        self._loaded = True
 
         # NOTA: La creación de directorios se movió a main.py/application.py
 
         defaults = self._get_default_config()
+        self._dirty = False
 
-        if self.config_file.exists():
-            self.logger.info(f"Configuración encontrada en: {self.config_file}")
-            try:
-                self.config.read(self.config_file, encoding="utf-8")
-                self._migrate_old_config()
-                self._validate_config(defaults)
-            except Exception as e:
-                self.logger.error(f"Error cargando configuración: {str(e)}")
-                self.logger.info("Usando configuración por defecto...")
-                self.config.read_dict(defaults)
+        try:
+            cache_key = self._stat_key()
+        except OSError:
+            cache_key = None
+
+        if cache_key is not None:
+            with _PARSED_CONFIG_LOCK:
+                cached = _PARSED_CONFIG_CACHE.get(cache_key)
+
+            if cached is not None:
+                sections, self._last_saved_hash, self._dirty = cached
+                self._data = self._copy_sections(sections)
+                self.logger.info("Configuración sin cambios en disco, reutilizando")
+            else:
+                self.logger.info(f"Configuración encontrada en: {self.config_file}")
+                try:
+                    try:
+                        self._data = self._fast_read(self.config_file)
+                    except Exception as e:
+                        # Sintaxis que la lectura rápida no cubre: ConfigParser
+                        self.logger.debug(
+                            f"Lectura rápida fallida ({e}), usando ConfigParser"
+                        )
+                        self._data = self._configparser_read(self.config_file)
+                    self._migrate_old_config()
+                    self._validate_config(defaults)
+                    self._remember_parsed(cache_key)
+                except Exception as e:
+                    self.logger.error(f"Error cargando configuración: {str(e)}")
+                    self.logger.info("Usando configuración por defecto...")
+                    self._data = self._copy_sections(defaults)
+                    # No marcar como modificada: guardar pisaría el archivo
+                    # del usuario con los valores por defecto
+                    self._dirty = False
         else:
             self.logger.info("Creando configuración por defecto...")
-            self.config.read_dict(defaults)
+            self._data = self._copy_sections(defaults)
             self.save_config()
 
-        return self.config
+        self._rebuild_flat()
+        return self._data
+
+    def _rebuild_flat(self):
+        """Reconstruye la vista plana de la configuración"""
+        inherited = self._data.get(_DEFAULT_SECTION, {})
+        flat: Dict[tuple, Any] = {
+            (section, option): value
+            for section, options in self._data.items()
+            for option, value in (
+                options.items()
+                if section == _DEFAULT_SECTION
+                else {**inherited, **options}.items()
+            )
+        }
+        # Los campos enteros validados se guardan ya convertidos
+        for section, field in _INT_FIELDS:
+            try:
+                flat[(section, field, int)] = int(flat[(section, field)])
+            except (KeyError, ValueError):
+                pass
+        self._flat = flat
+
+    def _stat_key(self) -> tuple:
+        """Clave de caché del archivo de configuración (lanza OSError si no existe)"""
+        st = os.stat(self.config_file)
+        return (str(self.config_file), st.st_mtime_ns, st.st_size)
+
+    def _remember_parsed(self, cache_key: tuple):
+        """Guarda en caché la configuración validada para esta versión del archivo"""
+        entry = (self._copy_sections(self._data), self._last_saved_hash, self._dirty)
+        with _PARSED_CONFIG_LOCK:
+            # Solo interesa la última versión de cada archivo
+            for key in [k for k in _PARSED_CONFIG_CACHE if k[0] == cache_key[0]]:
+                del _PARSED_CONFIG_CACHE[key]
+            _PARSED_CONFIG_CACHE[cache_key] = entry
+
+    @staticmethod
+    def _content_hash(data: bytes) -> str:
+        """Huella del contenido serializado de la configuración"""
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _fast_read(self, path: Path) -> Dict[str, Dict[str, str]]:
+        """Lee un archivo INI en una sola pasada sobre un búfer de 64 KiB"""
+        with open(path, "rb", buffering=_READ_BUFFER_SIZE) as f:
+            data = f.read()
+
+        sections: Dict[str, Dict[str, str]] = {}
+        current = None
+        # Última opción leída, su sangría y las líneas vacías pendientes:
+        # una línea más sangrada que la opción continúa su valor
+        key = None
+        key_indent = 0
+        blank_lines = 0
+        for raw_line in data.split(b"\n"):
+            line = raw_line.strip()
+            if not line:
+                blank_lines += 1
+                continue
+            if line[:1] in (b"#", b";"):
+                continue
+
+            indent = len(raw_line) - len(raw_line.lstrip())
+            if key is not None and indent > key_indent:
+                current[key] += "\n" * (blank_lines + 1) + line.decode("utf-8")
+                blank_lines = 0
+                continue
+            blank_lines = 0
+
+            if line[:1] == b"[" and line[-1:] == b"]":
+                name = line[1:-1].strip().decode("utf-8")
+                current = sections.setdefault(name, {})
+                key = None
+                continue
+
+            if current is None:
+                raise ValueError(f"Opción fuera de sección: {line!r}")
+
+            # Igual que ConfigParser: el primer '=' o ':' separa clave y valor
+            eq, colon = line.find(b"="), line.find(b":")
+            sep = eq if colon < 0 or 0 <= eq < colon else colon
+            if sep < 0:
+                raise ValueError(f"Línea inválida en configuración: {line!r}")
+
+            key = line[:sep].strip().decode("utf-8").lower()
+            key_indent = indent
+            current[key] = line[sep + 1 :].strip().decode("utf-8")
+
+        self._last_saved_hash = self._content_hash(data)
+        return sections
+
+    def _configparser_read(self, path: Path) -> Dict[str, Dict[str, str]]:
+        """Lee un archivo INI con ConfigParser (respaldo de _fast_read)"""
+        import configparser
+
+        with open(path, "rb") as f:
+            data = f.read()
+
+        # default_section=None: [DEFAULT] queda como una sección más y cada
+        # sección conserva solo sus propias opciones, igual que _fast_read
+        parser = configparser.ConfigParser(interpolation=None, default_section=None)
+        parser.read_string(data.decode("utf-8"), source=str(path))
+
+        self._last_saved_hash = self._content_hash(data)
+        return {section: dict(parser.items(section)) for section in parser.sections()}
+
+    @staticmethod
+    def _copy_sections(
+        sections: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, str]]:
+        """Copia un dict de secciones convirtiendo los valores a str"""
+        return {
+            section: {option: str(value) for option, value in options.items()}
+            for section, options in sections.items()
+        }
 
     def _get_default_config(self) -> Dict[str, Dict[str, Any]]:
         """Retorna la configuración por defecto"""
-        return {
-            "General": {
-                "model": "arch-chan",
-                "auto_cleanup": "true",
-                "max_history": "20",
-                "notifications": "true",
-                "language": "es",
-                "auto_update": "false",
-                "backup_enabled": "true",
-                "startup_minimized": "false",
-            },
-            "Paths": {
-                "project_path": str(self.project_path),
-                "models_path": str(self.models_path),
-                "temp_path": str(self.temp_path),
-                "logs_path": str(self.logs_path),
-                "configs_path": str(self.configs_path),
-            },
-            "Audio": {
-                "voice_enabled": "true",
-                "sample_rate": "22050",
-                "silence_threshold": "5%",
-                "voice_volume": "80",
-                "noise_reduction": "true",
-                "audio_quality": "high",
-                "input_device": "",
-                "output_device": "",
-            },
-            "UI": {
-                "theme": "arch-dark",
-                "window_width": "900",
-                "window_height": "700",
-                "sidebar_visible": "true",
-                "font_size": "11",
-                "animations": "true",
-                "compact_mode": "false",
-                "tray_enabled": "true",
-                "always_on_top": "false",
-            },
-            "Advanced": {
-                "timeout_duration": "120",
-                "max_response_length": "4000",
-                "retry_attempts": "3",
-                "cache_responses": "true",
-                "sudo_confirm": "true",
-                "block_dangerous": "true",
-                "debug_mode": "false",
-                "log_level": "INFO",
-            },
-        }
+        if self._defaults is None:
+            self._defaults = {
+                **_DEFAULT_CONFIG_STATIC,
+                "Paths": {
+                    "project_path": str(self.project_path),
+                    "models_path": str(self.models_path),
+                    "temp_path": str(self.temp_path),
+                    "logs_path": str(self.logs_path),
+                    "configs_path": str(self.configs_path),
+                },
+            }
+        return self._defaults
 
     def _migrate_old_config(self):
         """Migra configuraciones de versiones anteriores"""
@@ -128,39 +357,33 @@ class ConfigManager:
     def _validate_config(self, defaults: Dict[str, Dict[str, Any]]):
         """Valida la configuración cargada y añade claves faltantes"""
         try:
+            # Una sola pasada: añadir lo que falta y validar los enteros
+            sections = self._data
+            inherited = sections.get(_DEFAULT_SECTION, {})
             for section, options in defaults.items():
-                if not self.config.has_section(section):
-                    self.config.add_section(section)
+                current = sections.get(section)
+                if current is None:
+                    current = sections[section] = {}
+                    self._dirty = True
                     self.logger.info(f"Sección faltante '{section}' añadida a config")
 
                 for option, default_value in options.items():
-                    if not self.config.has_option(section, option):
-                        self.config.set(section, option, str(default_value))
+                    value = current.get(option, inherited.get(option))
+                    if value is None:
+                        current[option] = str(default_value)
+                        self._dirty = True
                         self.logger.info(
                             f"Opción faltante '{section}.{option}' añadida con valor por defecto"
                         )
-
-            # Validar valores numéricos
-            required_int_fields = {
-                "General": ["max_history"],
-                "UI": ["window_width", "window_height", "font_size"],
-                "Audio": ["sample_rate", "voice_volume"],
-                "Advanced": [
-                    "timeout_duration",
-                    "max_response_length",
-                    "retry_attempts",
-                ],
-            }
-
-            for section, fields in required_int_fields.items():
-                for field in fields:
-                    try:
-                        self.config.getint(section, field)
-                    except (ValueError, configparser.NoOptionError):
-                        self.logger.warning(
-                            f"Valor inválido para {section}.{field}, usando valor por defecto"
-                        )
-                        self.config.set(section, field, defaults[section][field])
+                    elif (section, option) in _INT_FIELDS:
+                        try:
+                            int(value)
+                        except ValueError:
+                            self.logger.warning(
+                                f"Valor inválido para {section}.{option}, usando valor por defecto"
+                            )
+                            current[option] = str(default_value)
+                            self._dirty = True
 
             self.logger.info("Validación y migración de configuración completada")
         except Exception as e:
@@ -168,16 +391,41 @@ class ConfigManager:
 
     def save_config(self) -> bool:
         """Guarda la configuración actual en archivo"""
+        # Sin cargar no hay nada nuevo que guardar (y se evita pisar el archivo)
+        if not self._loaded:
+            return True
+
+        # Nada cambió desde la última carga/guardado: cero E/S
+        if not self._dirty and self.config_file.exists():
+            return True
+
         try:
+            content = self._serialize()
+            data = content.encode("utf-8")
+
+            # Sin cambios respecto a lo último leído/guardado: nada que escribir
+            content_hash = self._content_hash(data)
+            if content_hash == self._last_saved_hash:
+                self.logger.debug("Configuración sin cambios, se omite el guardado")
+                self._dirty = False
+                return True
+
             if self.getboolean("General", "backup_enabled", fallback=True):
-                self._create_config_backup()
+                self._create_config_backup(content)
 
             # Asegurar que el directorio existe
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                self.config.write(f)
+            # Escritura atómica: un lector (o un fallo a mitad) nunca ve un
+            # archivo a medio escribir
+            tmp_file = self.config_file.with_suffix(".ini.tmp")
+            with open(tmp_file, "wb") as f:
+                f.write(data)
+            os.replace(tmp_file, self.config_file)
 
+            self._last_saved_hash = content_hash
+            self._dirty = False
+            self._remember_parsed(self._stat_key())
             self.logger.info("Configuración guardada correctamente")
             return True
 
@@ -185,18 +433,34 @@ class ConfigManager:
             self.logger.error(f"Error guardando configuración: {str(e)}")
             return False
 
-    def _create_config_backup(self):
+    def _serialize(self) -> str:
+        """Serializa la configuración con el mismo formato que ConfigParser.write"""
+        parts = []
+        # ConfigParser escribe [DEFAULT] primero y sangra las líneas de
+        # continuación de los valores multilínea
+        data = self._data
+        order = sorted(data, key=lambda section: section != _DEFAULT_SECTION)
+        for section in order:
+            parts.append(f"[{section}]\n")
+            for option, value in data[section].items():
+                value = value.replace("\n", "\n\t")
+                parts.append(f"{option} = {value}\n")
+            parts.append("\n")
+        return "".join(parts)
+
+    def _create_config_backup(self, content: str):
         """Crea un backup de la configuración"""
         try:
             # CORRECCIÓN: Asegurar que configs_path es Path antes de usar /
             backup_dir = Path(self.configs_path) / "backups"
-            backup_dir.mkdir(parents=True, exist_ok=True)
+            if not os.path.isdir(backup_dir):
+                os.makedirs(backup_dir, exist_ok=True)
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             backup_file = backup_dir / f"config_backup_{timestamp}.ini"
 
             with open(backup_file, "w", encoding="utf-8") as f:
-                self.config.write(f)
+                f.write(content)
 
             self._cleanup_old_backups(backup_dir)
 
@@ -206,47 +470,95 @@ class ConfigManager:
     def _cleanup_old_backups(self, backup_dir: Path, keep_count: int = 5):
         """Limpia backups antiguos"""
         try:
-            # CORRECCIÓN: Usar stat().st_mtime en lugar de os.path.getmtime
-            backup_files = sorted(
-                backup_dir.glob("config_backup_*.ini"),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True,
-            )
-            for old_backup in backup_files[keep_count:]:
-                old_backup.unlink()
+            # Una sola pasada de scandir: el mtime viene de la propia entrada
+            with os.scandir(backup_dir) as entries:
+                backup_files = [
+                    (entry.stat().st_mtime_ns, entry.path)
+                    for entry in entries
+                    if entry.name.startswith("config_backup_")
+                    and entry.name.endswith(".ini")
+                ]
+            if len(backup_files) <= keep_count:
+                return
+
+            # Solo hace falta conocer los keep_count más recientes
+            survivors = {path for _, path in heapq.nlargest(keep_count, backup_files)}
+            for _, path in backup_files:
+                if path not in survivors:
+                    os.unlink(path)
         except Exception as e:
             self.logger.warning(f"Error limpiando backups antiguos: {str(e)}")
 
     # Métodos de conveniencia (get, getboolean, getint, getfloat, set)
+    # Una sola búsqueda en la vista plana, sin pasar por ConfigParser; las
+    # conversiones se memorizan hasta que set() cambia esa opción
     def get(self, section: str, option: str, fallback: Any = None) -> Any:
-        try:
-            return self.config.get(section, option, fallback=fallback)
-        except (configparser.NoSectionError, configparser.NoOptionError):
-            return fallback
+        if not self._loaded:
+            self.load_config()
+        return self._flat.get((section, option.lower()), fallback)
 
     def getboolean(self, section: str, option: str, fallback: bool = False) -> bool:
-        try:
-            return self.config.getboolean(section, option, fallback=fallback)
-        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
-            return fallback
+        if not self._loaded:
+            self.load_config()
+        option = option.lower()
+        value = self._flat.get((section, option, bool), _MISS)
+        if value is _MISS:
+            raw = self._flat.get((section, option))
+            value = _BOOLEAN_STATES.get(raw.lower()) if raw is not None else None
+            if value is None:
+                return fallback
+            self._flat[(section, option, bool)] = value
+        return value
 
     def getint(self, section: str, option: str, fallback: int = 0) -> int:
-        try:
-            return self.config.getint(section, option, fallback=fallback)
-        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
-            return fallback
+        if not self._loaded:
+            self.load_config()
+        option = option.lower()
+        value = self._flat.get((section, option, int), _MISS)
+        if value is _MISS:
+            try:
+                value = int(self._flat[(section, option)])
+            except (KeyError, ValueError):
+                return fallback
+            self._flat[(section, option, int)] = value
+        return value
 
     def getfloat(self, section: str, option: str, fallback: float = 0.0) -> float:
-        try:
-            return self.config.getfloat(section, option, fallback=fallback)
-        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
-            return fallback
+        if not self._loaded:
+            self.load_config()
+        option = option.lower()
+        value = self._flat.get((section, option, float), _MISS)
+        if value is _MISS:
+            try:
+                value = float(self._flat[(section, option)])
+            except (KeyError, ValueError):
+                return fallback
+            self._flat[(section, option, float)] = value
+        return value
 
     def set(self, section: str, option: str, value: Any) -> bool:
+        if not self._loaded:
+            self.load_config()
         try:
-            if not self.config.has_section(section):
-                self.config.add_section(section)
-            self.config.set(section, option, str(value))
+            option = option.lower()
+            text = str(value)
+            self._data.setdefault(section, {})[option] = text
+
+            # Una opción de [DEFAULT] la heredan todas las secciones
+            if section == _DEFAULT_SECTION:
+                self._rebuild_flat()
+                self._dirty = True
+                return True
+
+            # Solo cambia esta opción: actualizar su entrada y olvidar sus
+            # conversiones
+            flat = self._flat
+            flat[(section, option)] = text
+            flat.pop((section, option, bool), None)
+            flat.pop((section, option, int), None)
+            flat.pop((section, option, float), None)
+
+            self._dirty = True
             return True
         except Exception as e:
             self.logger.error(f"Error estableciendo configuración: {str(e)}")
@@ -254,20 +566,31 @@ class ConfigManager:
 
     def get_all_settings(self) -> Dict[str, Dict[str, Any]]:
         """Retorna toda la configuración como diccionario"""
-        settings = {}
-        for section in self.config.sections():
-            settings[section] = dict(self.config.items(section))
-        return settings
+        if not self._loaded:
+            self.load_config()
+        # Como ConfigParser.sections()/items(): sin [DEFAULT], pero heredándola
+        inherited = self._data.get(_DEFAULT_SECTION, {})
+        return {
+            section: {**inherited, **options}
+            for section, options in self._data.items()
+            if section != _DEFAULT_SECTION
+        }
 
-    def get_available_languages(self) -> List[str]:
+    def get_available_languages(self) -> Sequence[str]:
         """Retorna la lista de idiomas disponibles"""
-        return ["es", "en", "fr", "de", "it", "pt", "ru", "ja", "zh"]
+        return _AVAILABLE_LANGUAGES
 
     def reset_to_defaults(self) -> bool:
         """Restablece la configuración a los valores por defecto"""
+        if not self._loaded:
+            self.load_config()
         try:
             defaults = self._get_default_config()
-            self.config.read_dict(defaults)
+            # update() copia los valores: la plantilla compartida no se toca
+            for section, options in defaults.items():
+                self._data.setdefault(section, {}).update(options)
+            self._rebuild_flat()
+            self._dirty = True
             return self.save_config()
         except Exception as e:
             self.logger.error(f"Error restableciendo configuración: {str(e)}")
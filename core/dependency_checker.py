@@ -1,15 +1,64 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import functools
+import hashlib
+import json
+import logging
 import os
-import subprocess
+import shutil
+import socket
 import sys
-from typing import Dict, List, Optional, Tuple
-
-import requests
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from utils.logger import get_logger
 
+# Rutas de ejecutables de la última verificación, válidas mientras PATH y
+# el contenido de sus directorios no cambien (y como mucho DEPS_CACHE_TTL)
+DEPS_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "arch-chan"
+    / "deps.json"
+)
+DEPS_CACHE_TTL = 24 * 60 * 60
+
+# Rutas comunes del sistema donde buscar ejecutables (además de PATH)
+COMMON_EXECUTABLE_PATHS = (
+    "/usr/bin",
+    "/usr/local/bin",
+    "/bin",
+    "/usr/sbin",
+    "/usr/libexec",
+    "/opt/bin",
+    "/snap/bin",
+    "/usr/games",
+    "/usr/local/sbin",
+)
+
+# Herramientas de elevación de privilegios aceptadas, por orden de preferencia
+PRIVILEGE_ESCALATION_TOOLS = ("kdesu", "pkexec", "gksudo", "kdesudo", "beesu")
+
+# Sonda de disponibilidad de Ollama: basta con que el puerto acepte conexiones
+OLLAMA_PROBE_ADDRESS = ("127.0.0.1", 11434)
+OLLAMA_PROBE_TIMEOUT = 0.25
+
+# Tiempo durante el que se reutiliza el resultado de la sonda a Ollama
+OLLAMA_PROBE_TTL = 2.0
+
+# Tiempo durante el que se reutilizan las demás comprobaciones del sistema
+PROBE_CACHE_TTL = 30.0
+
+
+@functools.lru_cache(maxsize=None)
+def _which(command: str, path_env: str) -> Optional[str]:
+    """shutil.which memorizado por comando y valor de PATH"""
+    return shutil.which(command, path=path_env)
+
 
 class DependencyError(Exception):
     """Excepción para dependencias faltantes"""
@@ -41,16 +90,37 @@ class DependencyChecker:
             "psutil": "psutil",
         }
 
+        # Directorios de PATH, separados una sola vez
+        self._path_dirs = os.environ.get("PATH", "").split(os.pathsep)
+        # Rutas comunes + PATH, sin vacíos ni duplicados, en orden de búsqueda
+        self._search_dirs = tuple(
+            dict.fromkeys(
+                d for d in COMMON_EXECUTABLE_PATHS + tuple(self._path_dirs) if d
+            )
+        )
+
         # Ejecutables encontrados
         self.found_executables = {}
         self.found_python_packages = {}
 
+        # Ejecutables de la verificación anterior (None si no son válidos)
+        self._cached_executables: Optional[Dict[str, Optional[str]]] = None
+        # Instante en que se generó la caché cargada (para conservarlo)
+        self._cached_ts: Optional[float] = None
+
+        # Resultados de sondas: clave -> (instante monotónico, resultado)
+        self._probe_cache: Dict[str, Tuple[float, Any]] = {}
+
         self.logger.info("DependencyChecker inicializado")
 
-    def check_all_dependencies(self) -> bool:
+    def check_all_dependencies(self, fail_fast: bool = False) -> bool:
         """
         Verifica todas las dependencias requeridas
 
+        Args:
+            fail_fast: Abortar en la primera dependencia crítica que falte,
+                cancelando las comprobaciones pendientes
+
         Returns:
             True si todas las dependencias están disponibles
 
@@ -62,42 +132,64 @@ class DependencyChecker:
         missing_dependencies = []
         warning_dependencies = []
 
-        # Verificar herramientas del sistema
-        for name, command in self.required_tools.items():
-            try:
-                if name == "ollama":
-                    # Verificación especial para Ollama (servicio)
-                    if not self._check_ollama_service():
+        signature = self._path_signature()
+        self._cached_executables = self._load_executables_cache(signature)
+        checked_executables: Dict[str, Optional[str]] = {}
+
+        # Todas las comprobaciones son de E/S (procesos, HTTP, disco) y no
+        # dependen entre sí: se lanzan a la vez y se recogen en orden
+        with ThreadPoolExecutor(
+            max_workers=min(16, len(self.required_tools) + 1)
+        ) as executor:
+            tool_futures = [
+                (name, command, executor.submit(self._check_tool, name, command))
+                for name, command in self.required_tools.items()
+            ]
+            kdesu_future = executor.submit(self._check_kdesu_alternatives)
+            pending = [future for _, _, future in tool_futures] + [kdesu_future]
+
+            # Verificar paquetes de Python (en este hilo, mientras tanto)
+            python_missing = self._check_python_packages()
+            if fail_fast and python_missing:
+                self._abort_check(executor, pending, python_missing[0])
+
+            # Verificar herramientas del sistema
+            for name, command, future in tool_futures:
+                try:
+                    found, executable_path = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error verificando {name}: {str(e)}")
+                    if name not in ["kdialog"]:
                         missing_dependencies.append(name)
-                        continue
-                else:
-                    # Verificación de comandos normales
-                    executable_path = self._find_executable(command)
-                    if not executable_path:
-                        if name in ["kdialog"]:  # Dependencias opcionales
-                            warning_dependencies.append(name)
-                        else:
-                            missing_dependencies.append(name)
-                        continue
+                        if fail_fast:
+                            self._abort_check(executor, pending, name)
+                    continue
+
+                if name != "ollama":
+                    checked_executables[command] = executable_path
 
+                if not found:
+                    if name in ["kdialog"]:  # Dependencias opcionales
+                        warning_dependencies.append(name)
+                    else:
+                        missing_dependencies.append(name)
+                        if fail_fast:
+                            self._abort_check(executor, pending, name)
+                elif executable_path:
                     # Guardar ruta encontrada
                     self.found_executables[command] = executable_path
 
-                    # Verificación adicional para herramientas críticas
-                    if command in ["piper-tts", "whisper-cli"]:
-                        self._verify_tool_version(command, executable_path)
-
-            except Exception as e:
-                self.logger.error(f"Error verificando {name}: {str(e)}")
-                if name not in ["kdialog"]:
-                    missing_dependencies.append(name)
+            kdesu_available = kdesu_future.result()
 
-        # Verificar paquetes de Python
-        python_missing = self._check_python_packages()
+        # Con la caché vigente y sin cambios no hay nada que escribir; si se
+        # reescribe se conserva su instante original para que el TTL expire
+        if checked_executables != self._cached_executables:
+            self._save_executables_cache(
+                signature, checked_executables, self._cached_ts
+            )
         missing_dependencies.extend(python_missing)
 
         # Verificar kdesu/alternativas
-        kdesu_available = self._check_kdesu_alternatives()
         if not kdesu_available:
             warning_dependencies.append("kdesu/pkexec")
 
@@ -115,6 +207,51 @@ class DependencyChecker:
         self.logger.info("Todas las dependencias verificadas correctamente")
         return True
 
+    def _abort_check(
+        self, executor: ThreadPoolExecutor, futures: List[Future], name: str
+    ):
+        """Cancela las comprobaciones pendientes y lanza DependencyError"""
+        # shutdown(cancel_futures=True) no existe antes de Python 3.9
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+        self.logger.error(f"Dependencia faltante: {name}")
+        raise DependencyError(f"Herramientas faltantes: {name}")
+
+    def _check_tool(self, name: str, command: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verifica una herramienta del sistema (seguro en un hilo secundario)
+
+        Returns:
+            (disponible, ruta del ejecutable o None)
+        """
+        if name == "ollama":
+            # Verificación especial para Ollama (servicio)
+            return self._check_ollama_service(), None
+
+        # Verificación de comandos normales (reutilizando la anterior si vale)
+        cached = self._cached_executables
+        if cached is not None and command in cached:
+            executable_path = cached[command]
+        else:
+            executable_path = self._find_executable(command)
+        if not executable_path:
+            return False, None
+
+        # Verificación adicional para herramientas críticas: solo informa en
+        # el log, así que se hace en segundo plano y solo en modo depuración
+        if command in ["piper-tts", "whisper-cli"] and self.logger.isEnabledFor(
+            logging.DEBUG
+        ):
+            threading.Thread(
+                target=self._verify_tool_version,
+                args=(command, executable_path),
+                name=f"verify-{command}",
+                daemon=True,
+            ).start()
+
+        return True, executable_path
+
     def _find_executable(self, command: str) -> Optional[str]:
         """
         Busca un ejecutable en el sistema
@@ -125,106 +262,106 @@ class DependencyChecker:
         Returns:
             Ruta del ejecutable o None si no se encuentra
         """
-        methods = [
-            self._find_with_which,
-            self._find_with_whereis,
-            self._find_in_common_paths,
-        ]
+        # Búsqueda en PATH dentro del propio proceso (sin lanzar which/whereis)
+        path = _which(command, os.environ.get("PATH", os.defpath))
+        method = "shutil.which"
+        if not path:
+            path = self._find_in_common_paths(command)
+            method = "_find_in_common_paths"
 
-        for method in methods:
-            try:
-                path = method(command)
-                if path:
-                    self.logger.info(
-                        f"'{command}' encontrado via {method.__name__}: {path}"
-                    )
-                    return path
-            except Exception as e:
-                self.logger.debug(
-                    f"Error en {method.__name__} para {command}: {str(e)}"
-                )
+        if path:
+            self.logger.info(f"'{command}' encontrado via {method}: {path}")
+            return path
 
         self.logger.warning(f"Ejecutable no encontrado: {command}")
         return None
 
-    def _find_with_which(self, command: str) -> Optional[str]:
-        """Busca usando el comando which"""
-        try:
-            result = subprocess.run(
-                ["which", command],
-                capture_output=True,
-                timeout=5,
-                text=True,
-                check=False,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip().split("\n")[0]
-        except Exception as e:
-            self.logger.debug(f"Error usando 'which' para {command}: {str(e)}")
-        return None
-
-    def _find_with_whereis(self, command: str) -> Optional[str]:
-        """Busca usando el comando whereis"""
-        try:
-            result = subprocess.run(
-                ["whereis", "-b", command],
-                capture_output=True,
-                timeout=5,
-                text=True,
-                check=False,
-            )
-            if result.returncode == 0:
-                output = result.stdout.strip()
-                if ":" in output:
-                    paths = output.split(":", 1)[1].strip()
-                    if paths:
-                        for path in paths.split():
-                            if os.path.exists(path) and os.access(path, os.X_OK):
-                                return path
-        except Exception as e:
-            self.logger.debug(f"Error usando 'whereis' para {command}: {str(e)}")
-        return None
-
     def _find_in_common_paths(self, command: str) -> Optional[str]:
         """Busca en rutas comunes del sistema"""
-        common_paths = [
-            "/usr/bin",
-            "/usr/local/bin",
-            "/bin",
-            "/usr/sbin",
-            "/usr/libexec",
-            "/opt/bin",
-            "/snap/bin",
-            "/usr/games",
-            "/usr/local/sbin",
-        ]
-
-        # También verificar en PATH
-        path_dirs = os.environ.get("PATH", "").split(":")
-        common_paths.extend(path_dirs)
-
-        for base_path in common_paths:
-            if not base_path:
-                continue
+        for base_path in self._search_dirs:
             potential_path = os.path.join(base_path, command)
-            if os.path.exists(potential_path) and os.access(potential_path, os.X_OK):
+            # access() ya falla si el archivo no existe: un solo syscall
+            if os.access(potential_path, os.X_OK):
                 return potential_path
 
         return None
 
+    def _path_signature(self) -> str:
+        """Firma de PATH y de la fecha de modificación de sus directorios"""
+        parts = [os.environ.get("PATH", "")]
+        for directory in self._search_dirs:
+            try:
+                parts.append(f"{directory}:{os.stat(directory).st_mtime_ns}")
+            except OSError:
+                parts.append(f"{directory}:-")
+        data = "|".join(parts).encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _load_executables_cache(
+        self, signature: str
+    ) -> Optional[Dict[str, Optional[str]]]:
+        """Carga las rutas guardadas si la firma coincide y siguen siendo ejecutables"""
+        self._cached_ts = None
+        try:
+            with open(DEPS_CACHE_FILE, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if cache.get("path_hash") != signature:
+            return None
+        ts = cache.get("ts", 0)
+        if not 0 <= time.time() - ts < DEPS_CACHE_TTL:
+            return None
+
+        executables = cache.get("execs", {})
+        for path in executables.values():
+            if path and not os.access(path, os.X_OK):
+                return None
+
+        self.logger.debug("Usando rutas de ejecutables de la verificación anterior")
+        self._cached_ts = ts
+        return executables
+
+    def _save_executables_cache(
+        self,
+        signature: str,
+        executables: Dict[str, Optional[str]],
+        ts: Optional[float] = None,
+    ):
+        """Guarda las rutas encontradas para el siguiente arranque"""
+        if ts is None:
+            ts = time.time()
+        try:
+            DEPS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(DEPS_CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump({"path_hash": signature, "ts": ts, "execs": executables}, f)
+        except OSError as e:
+            self.logger.debug(f"No se pudo guardar la caché de dependencias: {e}")
+
+    def _cached(self, key: str, ttl: float, probe: Callable[[], Any]) -> Any:
+        """Devuelve el resultado de probe, reutilizándolo durante ttl segundos"""
+        entry = self._probe_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        result = probe()
+        self._probe_cache[key] = (time.monotonic(), result)
+        return result
+
     def _check_ollama_service(self) -> bool:
         """Verifica que el servicio Ollama esté ejecutándose"""
+        return self._cached("ollama", OLLAMA_PROBE_TTL, self._probe_ollama_service)
+
+    def _probe_ollama_service(self) -> bool:
+        """Comprueba que el puerto de Ollama acepta conexiones"""
         try:
-            response = requests.get("http://localhost:11434/api/tags", timeout=5)
-            if response.status_code == 200:
-                self.logger.info("Ollama service is running")
-                return True
-            else:
-                self.logger.warning(
-                    f"Ollama responded with status {response.status_code}"
-                )
-                return False
-        except Exception as e:
+            socket.create_connection(
+                OLLAMA_PROBE_ADDRESS, timeout=OLLAMA_PROBE_TIMEOUT
+            ).close()
+            self.logger.info("Ollama service is running")
+            return True
+        except OSError as e:
             self.logger.debug(f"Ollama no responde: {str(e)}")
             return False
 
@@ -234,12 +371,13 @@ class DependencyChecker:
 
         for name, package in self.required_python_packages.items():
             try:
-                __import__(package)
+                # Solo se comprueba que exista: no se ejecuta el módulo
+                if find_spec(package) is None:
+                    self.logger.error(f"Paquete Python faltante: {name} ({package})")
+                    missing_packages.append(name)
+                    continue
                 self.found_python_packages[package] = True
                 self.logger.info(f"Paquete Python '{name}' encontrado")
-            except ImportError as e:
-                self.logger.error(f"Paquete Python faltante: {name} ({package})")
-                missing_packages.append(name)
             except Exception as e:
                 self.logger.error(f"Error verificando paquete {name}: {str(e)}")
                 missing_packages.append(name)
@@ -248,23 +386,17 @@ class DependencyChecker:
 
     def _check_kdesu_alternatives(self) -> bool:
         """Verifica la disponibilidad de kdesu o alternativas"""
-        alternatives = ["kdesu", "pkexec", "gksudo", "kdesudo", "beesu"]
+        return self._cached("kdesu", PROBE_CACHE_TTL, self._probe_kdesu_alternatives)
 
-        for alt in alternatives:
-            try:
-                result = subprocess.run(
-                    ["which", alt],
-                    capture_output=True,
-                    timeout=5,
-                    text=True,
-                    check=False,
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    self.logger.info(f"Alternativa de elevación encontrada: {alt}")
-                    return True
-            except Exception as e:
-                self.logger.debug(f"Error verificando {alt}: {str(e)}")
-                continue
+    def _probe_kdesu_alternatives(self) -> bool:
+        """Busca kdesu o alguna alternativa en PATH"""
+        path_env = os.environ.get("PATH", os.defpath)
+        alt = next(
+            (a for a in PRIVILEGE_ESCALATION_TOOLS if _which(a, path_env)), None
+        )
+        if alt is not None:
+            self.logger.info(f"Alternativa de elevación encontrada: {alt}")
+            return True
 
         self.logger.warning(
             "No se encontraron alternativas de elevación de privilegios"
@@ -273,6 +405,9 @@ class DependencyChecker:
 
     def _verify_tool_version(self, command: str, executable_path: str):
         """Verifica la versión de una herramienta"""
+        # Solo se usa en modo depuración: no cargar subprocess al importar
+        import subprocess
+
         try:
             if command == "piper-tts":
                 result = subprocess.run(
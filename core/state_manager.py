@@ -1,9 +1,12 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from collections import defaultdict, deque
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import partial
+from itertools import islice
+from typing import DefaultDict, Deque, Dict, FrozenSet, List, Optional
 
 from PySide6.QtCore import QObject, Signal
 
@@ -23,9 +26,57 @@ class AppState(Enum):
     SHUTTING_DOWN = "shutting_down"
 
 
+# Transiciones permitidas desde cada estado
+_TRANSITIONS: Dict[AppState, FrozenSet[AppState]] = {
+    AppState.STARTING: frozenset(
+        {AppState.IDLE, AppState.ERROR, AppState.SHUTTING_DOWN}
+    ),
+    AppState.IDLE: frozenset(
+        {
+            AppState.LISTENING,
+            AppState.PROCESSING,
+            AppState.UPDATING,
+            AppState.ERROR,
+            AppState.SHUTTING_DOWN,
+        }
+    ),
+    AppState.LISTENING: frozenset({AppState.PROCESSING, AppState.IDLE, AppState.ERROR}),
+    AppState.PROCESSING: frozenset({AppState.SPEAKING, AppState.IDLE, AppState.ERROR}),
+    AppState.SPEAKING: frozenset({AppState.IDLE, AppState.ERROR}),
+    AppState.UPDATING: frozenset({AppState.IDLE, AppState.ERROR}),
+    AppState.ERROR: frozenset({AppState.IDLE, AppState.SHUTTING_DOWN}),
+    AppState.SHUTTING_DOWN: frozenset(),  # Estado final
+}
+
+# Estados en los que la aplicación está ocupada
+_BUSY_STATES = frozenset(
+    {
+        AppState.LISTENING,
+        AppState.PROCESSING,
+        AppState.SPEAKING,
+        AppState.UPDATING,
+        AppState.STARTING,
+        AppState.SHUTTING_DOWN,
+    }
+)
+
+
 class AppStateManager(QObject):
     """Gestor centralizado del estado de la aplicación"""
 
+    __slots__ = (
+        "logger",
+        "_current_state",
+        "_previous_state",
+        "_state_history",
+        "_error_message",
+        "_warning_message",
+        "_status_message",
+        "_state_start_time",
+        "_app_start_time",
+        "_state_change_count",
+    )
+
     # Señales
     state_changed = Signal(AppState, AppState)  # old_state, new_state
     error_occurred = Signal(str)
@@ -39,7 +90,8 @@ class AppStateManager(QObject):
         # Estado actual y histórico
         self._current_state = AppState.STARTING
         self._previous_state = None
-        self._state_history: List[Dict] = []
+        # Historial acotado: al pasar de 100 entradas se descartan las antiguas
+        self._state_history: Deque[Dict] = deque(maxlen=100)
 
         # Información de estado
         self._error_message = ""
@@ -47,8 +99,7 @@ class AppStateManager(QObject):
         self._status_message = "Aplicación iniciando..."
 
         # Tiempos de estado
-        self._state_start_time = datetime.now()
-        self._app_start_time = datetime.now()
+        self._state_start_time = self._app_start_time = datetime.now()
 
         # Contadores
         self._state_change_count = 0
@@ -68,15 +119,7 @@ class AppStateManager(QObject):
     @property
     def is_busy(self) -> bool:
         """Indica si la aplicación está ocupada"""
-        busy_states = [
-            AppState.LISTENING,
-            AppState.PROCESSING,
-            AppState.SPEAKING,
-            AppState.UPDATING,
-            AppState.STARTING,
-            AppState.SHUTTING_DOWN,
-        ]
-        return self._current_state in busy_states
+        return self._current_state in _BUSY_STATES
 
     @property
     def can_accept_input(self) -> bool:
@@ -113,25 +156,22 @@ class AppStateManager(QObject):
         self._previous_state = old_state
         self._current_state = new_state
 
-        # Calcular duración del estado anterior
-        state_duration = (datetime.now() - self._state_start_time).total_seconds()
-        self._state_start_time = datetime.now()
+        # Calcular duración del estado anterior (una sola lectura del reloj)
+        now = datetime.now()
+        state_duration = (now - self._state_start_time).total_seconds()
+        self._state_start_time = now
 
         # Guardar en historial
         state_record = {
             "from_state": old_state.value,
             "to_state": new_state.value,
-            "timestamp": datetime.now(),
+            "timestamp": now,
             "duration_seconds": state_duration,
             "reason": reason,
         }
         self._state_history.append(state_record)
         self._state_change_count += 1
 
-        # Limitar historial a 100 entradas
-        if len(self._state_history) > 100:
-            self._state_history = self._state_history[-100:]
-
         self.logger.info(
             f"Cambio de estado: {old_state.value} -> {new_state.value}"
             + (f" ({reason})" if reason else "")
@@ -140,21 +180,15 @@ class AppStateManager(QObject):
         self.state_changed.emit(old_state, new_state)
         return True
 
-    def set_idle(self, reason: str = "") -> bool:
-        """Establece el estado en IDLE"""
-        return self.set_state(AppState.IDLE, reason)
-
-    def set_listening(self, reason: str = "") -> bool:
-        """Establece el estado en LISTENING"""
-        return self.set_state(AppState.LISTENING, reason)
-
-    def set_processing(self, reason: str = "") -> bool:
-        """Establece el estado en PROCESSING"""
-        return self.set_state(AppState.PROCESSING, reason)
-
-    def set_speaking(self, reason: str = "") -> bool:
-        """Establece el estado en SPEAKING"""
-        return self.set_state(AppState.SPEAKING, reason)
+    def __getattr__(self, name: str):
+        """Resuelve set_idle, set_listening, ... como set_state(AppState.X, reason)"""
+        if name.startswith("set_"):
+            state = AppState.__members__.get(name[4:].upper())
+            if state is not None:
+                return partial(self.set_state, state)
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
 
     def set_error(self, error_message: str = "", reason: str = "") -> bool:
         """Establece el estado en ERROR"""
@@ -164,18 +198,6 @@ class AppStateManager(QObject):
             self.error_occurred.emit(error_message)
         return success
 
-    def set_updating(self, reason: str = "") -> bool:
-        """Establece el estado en UPDATING"""
-        return self.set_state(AppState.UPDATING, reason)
-
-    def set_starting(self, reason: str = "") -> bool:
-        """Establece el estado en STARTING"""
-        return self.set_state(AppState.STARTING, reason)
-
-    def set_shutting_down(self, reason: str = "") -> bool:
-        """Establece el estado en SHUTTING_DOWN"""
-        return self.set_state(AppState.SHUTTING_DOWN, reason)
-
     def get_error_message(self) -> str:
         """Retorna el mensaje de error"""
         return self._error_message
@@ -205,6 +227,9 @@ class AppStateManager(QObject):
 
     def set_status_message(self, message: str):
         """Establece un mensaje de estado general"""
+        # Mismo mensaje: evitar emitir (y repintar la barra de estado)
+        if message == self._status_message:
+            return
         self._status_message = message
         self.status_message.emit(message)
 
@@ -214,25 +239,7 @@ class AppStateManager(QObject):
 
     def can_transition_to(self, new_state: AppState) -> bool:
         """Verifica si es posible transicionar a un nuevo estado"""
-        transitions = {
-            AppState.STARTING: [AppState.IDLE, AppState.ERROR, AppState.SHUTTING_DOWN],
-            AppState.IDLE: [
-                AppState.LISTENING,
-                AppState.PROCESSING,
-                AppState.UPDATING,
-                AppState.ERROR,
-                AppState.SHUTTING_DOWN,
-            ],
-            AppState.LISTENING: [AppState.PROCESSING, AppState.IDLE, AppState.ERROR],
-            AppState.PROCESSING: [AppState.SPEAKING, AppState.IDLE, AppState.ERROR],
-            AppState.SPEAKING: [AppState.IDLE, AppState.ERROR],
-            AppState.UPDATING: [AppState.IDLE, AppState.ERROR],
-            AppState.ERROR: [AppState.IDLE, AppState.SHUTTING_DOWN],
-            AppState.SHUTTING_DOWN: [],  # Estado final
-        }
-
-        allowed_transitions = transitions.get(self._current_state, [])
-        return new_state in allowed_transitions
+        return new_state in _TRANSITIONS.get(self._current_state, frozenset())
 
     def force_state(self, new_state: AppState, reason: str = "") -> bool:
         """Fuerza un cambio de estado (usar con cuidado)"""
@@ -241,13 +248,14 @@ class AppStateManager(QObject):
         self._current_state = new_state
 
         # Registrar cambio forzado
-        state_duration = (datetime.now() - self._state_start_time).total_seconds()
-        self._state_start_time = datetime.now()
+        now = datetime.now()
+        state_duration = (now - self._state_start_time).total_seconds()
+        self._state_start_time = now
 
         state_record = {
             "from_state": old_state.value,
             "to_state": new_state.value,
-            "timestamp": datetime.now(),
+            "timestamp": now,
             "duration_seconds": state_duration,
             "reason": f"FORCED: {reason}",
             "forced": True,
@@ -265,8 +273,9 @@ class AppStateManager(QObject):
 
     def get_state_info(self) -> Dict:
         """Retorna información completa del estado actual"""
-        current_duration = (datetime.now() - self._state_start_time).total_seconds()
-        total_uptime = (datetime.now() - self._app_start_time).total_seconds()
+        now = datetime.now()
+        current_duration = (now - self._state_start_time).total_seconds()
+        total_uptime = (now - self._app_start_time).total_seconds()
 
         return {
             "current_state": self._current_state.value,
@@ -286,36 +295,35 @@ class AppStateManager(QObject):
         }
 
     def get_state_history(self, limit: int = 10) -> List[Dict]:
-        """Retorna el historial de estados recientes"""
-        return self._state_history[-limit:] if self._state_history else []
+        """Retorna el historial de estados recientes (limit=0: completo)"""
+        history = self._state_history
+        # Misma semántica que history[-limit:] sin copiar el deque entero
+        start = len(history) - limit if limit > 0 else -limit
+        return list(islice(history, max(0, start), None))
 
     def get_state_statistics(self) -> Dict:
         """Retorna estadísticas de uso de estados"""
         if not self._state_history:
             return {}
 
-        stats = {}
-        total_time = 0
+        stats: DefaultDict[str, Dict] = defaultdict(
+            lambda: {"count": 0, "total_time": 0.0}
+        )
+        total_time = 0.0
 
         for record in self._state_history:
-            state = record["to_state"]
+            state_data = stats[record["to_state"]]
             duration = record.get("duration_seconds", 0)
-
-            if state not in stats:
-                stats[state] = {"count": 0, "total_time": 0.0}
-
-            stats[state]["count"] += 1
-            stats[state]["total_time"] += duration
+            state_data["count"] += 1
+            state_data["total_time"] += duration
             total_time += duration
 
         # Calcular porcentajes
-        for state_data in stats.values():
-            if total_time > 0:
-                state_data["percentage"] = (state_data["total_time"] / total_time) * 100
-            else:
-                state_data["percentage"] = 0
-
-        return stats
+        scale = 100 / total_time if total_time > 0 else 0
+        return {
+            state: {**state_data, "percentage": state_data["total_time"] * scale}
+            for state, state_data in stats.items()
+        }
 
     def reset(self):
         """Reinicia el estado manager (para testing)"""
@@ -325,6 +333,5 @@ class AppStateManager(QObject):
         self._error_message = ""
         self._warning_message = ""
         self._status_message = "Reiniciado"
-        self._state_start_time = datetime.now()
-        self._app_start_time = datetime.now()
+        self._state_start_time = self._app_start_time = datetime.now()
         self._state_change_count = 0
@@ -1,117 +1,191 @@
 #!/usr/bin/env python3
 
-import importlib
 import os
 import sys
-import traceback
 from pathlib import Path
-
-
-def check_file_exists(file_path):
-    """Verifica si un archivo existe"""
-    exists = os.path.exists(file_path)
+from typing import Final
+
+# Directorio del proyecto, resuelto una sola vez
+_CUR_STR = os.fspath(Path(__file__).resolve().parent)
+current_dir = Path(_CUR_STR)
+
+# Archivos que deben existir, relativos al directorio del proyecto
+ESSENTIAL_FILES: Final = (
+    "main.py",
+    "core/__init__.py",
+    "core/config_manager.py",
+    "core/state_manager.py",
+    "core/application.py",
+    "ui/__init__.py",
+    "ui/main_window.py",
+    "ui/components/__init__.py",
+    "ui/components/chat_panel.py",
+    "ui/components/side_panel.py",
+    "ui/components/toolbar.py",
+    "ui/components/status_bar.py",
+    "utils/__init__.py",
+    "utils/logger.py",
+)
+
+# Directorios que deben existir
+DIRECTORIES: Final = ("core", "ui", "ui/components", "utils")
+
+# Módulos a importar y la clase o función a comprobar en cada uno
+BASIC_IMPORTS: Final = (
+    ("PySide6.QtWidgets", "QApplication"),
+    ("PySide6.QtCore", "QObject"),
+    ("utils.logger", "setup_logging"),
+    ("core.config_manager", "ConfigManager"),
+    ("core.state_manager", "AppStateManager"),
+    ("core.application", "ArchChanApplication"),
+    ("ui.main_window", "MainWindow"),
+)
+
+
+class Reporter:
+    """Acumula las líneas de salida y las escribe de una sola vez"""
+
+    def __init__(self):
+        self.lines = []
+
+    def line(self, message=""):
+        self.lines.append(message)
+
+    def flush(self):
+        """Escribe las líneas pendientes con una sola llamada a write()"""
+        if not self.lines:
+            return
+        text = "\n".join(self.lines) + "\n"
+        self.lines.clear()
+        stdout = sys.stdout
+        buffer = getattr(stdout, "buffer", None)
+        if buffer is None:
+            stdout.write(text)
+            stdout.flush()
+            return
+        # Escribir los bytes directamente, sin pasar por la capa de texto
+        stdout.flush()
+        buffer.write(text.encode(stdout.encoding or "utf-8", stdout.errors or "strict"))
+        buffer.flush()
+
+
+def scan_paths(base_dir, rel_dirs):
+    """Lista cada directorio una sola vez y retorna las rutas relativas existentes
+
+    Los directorios se incluyen con una barra final ("ui/components/").
+    """
+    known = set()
+    for rel_dir in set(rel_dirs):
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        try:
+            with os.scandir(os.path.join(base_dir, rel_dir)) as entries:
+                for entry in entries:
+                    suffix = "/" if entry.is_dir() else ""
+                    known.add(f"{prefix}{entry.name}{suffix}")
+        except OSError:
+            continue
+    return known
+
+
+def check_file_exists(file_path, known=None, rel_path=None, report=print):
+    """Verifica si un archivo existe (en known si se ha escaneado antes)"""
+    if known is not None and rel_path is not None:
+        exists = rel_path in known
+    else:
+        exists = os.path.exists(file_path)
     status = "✅" if exists else "❌"
-    print(f"{status} {file_path}")
+    report(f"{status} {file_path}")
     return exists
 
 
-def check_module_import(module_path, class_name=None):
+def check_module_import(module_path, class_name=None, report=print):
     """Verifica si un módulo puede ser importado"""
+    import importlib
+    import importlib.util
+
     try:
-        module = importlib.import_module(module_path)
         if class_name:
+            # Reutilizar el módulo si un import anterior ya lo cargó
+            modules = sys.modules
+            module = modules.get(module_path) or importlib.import_module(module_path)
             getattr(module, class_name)
-            print(f"✅ {module_path}.{class_name}")
+            report(f"✅ {module_path}.{class_name}")
         else:
-            print(f"✅ {module_path}")
+            # Sin clase que comprobar basta con localizar el módulo
+            if importlib.util.find_spec(module_path) is None:
+                raise ImportError(f"No module named '{module_path}'")
+            report(f"✅ {module_path}")
         return True
     except Exception as e:
-        print(f"❌ {module_path}{f'.{class_name}' if class_name else ''}: {e}")
+        report(f"❌ {module_path}{f'.{class_name}' if class_name else ''}: {e}")
         return False
 
 
 def main():
-    print("🔍 DIAGNÓSTICO DE ARCH-CHAN AI ASSISTANT")
-    print("=" * 50)
+    out = Reporter()
+    out.line("🔍 DIAGNÓSTICO DE ARCH-CHAN AI ASSISTANT")
+    out.line("=" * 50)
 
-    current_dir = Path(__file__).parent
-    print(f"📁 Directorio actual: {current_dir}")
-    print()
+    out.line(f"📁 Directorio actual: {current_dir}")
+    out.line()
 
     # Verificar archivos esenciales
-    print("📄 VERIFICANDO ARCHIVOS ESENCIALES:")
-    essential_files = [
-        "main.py",
-        "core/__init__.py",
-        "core/config_manager.py",
-        "core/state_manager.py",
-        "core/application.py",
-        "ui/__init__.py",
-        "ui/main_window.py",
-        "ui/components/__init__.py",
-        "ui/components/chat_panel.py",
-        "ui/components/side_panel.py",
-        "ui/components/toolbar.py",
-        "ui/components/status_bar.py",
-        "utils/__init__.py",
-        "utils/logger.py",
-    ]
+    out.line("📄 VERIFICANDO ARCHIVOS ESENCIALES:")
+
+    # Un listado por directorio en lugar de un stat() por ruta
+    known = scan_paths(
+        _CUR_STR,
+        [os.path.dirname(path) for path in ESSENTIAL_FILES + DIRECTORIES],
+    )
 
     all_files_exist = True
-    for file in essential_files:
-        if not check_file_exists(current_dir / file):
+    for file in ESSENTIAL_FILES:
+        if not check_file_exists(os.path.join(_CUR_STR, file), known, file, out.line):
             all_files_exist = False
 
-    print()
+    out.line()
+
+    # Los imports pueden tardar: mostrar antes lo ya comprobado
+    out.flush()
 
     # Verificar imports básicos
-    print("📦 VERIFICANDO IMPORTS BÁSICOS:")
-    basic_imports = [
-        ("PySide6.QtWidgets", "QApplication"),
-        ("PySide6.QtCore", "QObject"),
-        ("utils.logger", "setup_logging"),
-        ("core.config_manager", "ConfigManager"),
-        ("core.state_manager", "AppStateManager"),
-        ("core.application", "ArchChanApplication"),
-        ("ui.main_window", "MainWindow"),
-    ]
+    out.line("📦 VERIFICANDO IMPORTS BÁSICOS:")
 
     all_imports_work = True
-    for module, class_name in basic_imports:
-        if not check_module_import(module, class_name):
+    for module, class_name in BASIC_IMPORTS:
+        if not check_module_import(module, class_name, out.line):
             all_imports_work = False
 
-    print()
+    out.line()
 
     # Verificar estructura de directorios
-    print("📁 VERIFICANDO ESTRUCTURA:")
-    directories = ["core", "ui", "ui/components", "utils"]
-    for dir_name in directories:
-        dir_path = current_dir / dir_name
-        exists = dir_path.exists() and dir_path.is_dir()
+    out.line("📁 VERIFICANDO ESTRUCTURA:")
+    for dir_name in DIRECTORIES:
+        exists = f"{dir_name}/" in known
         status = "✅" if exists else "❌"
-        print(f"{status} {dir_name}/")
+        out.line(f"{status} {dir_name}/")
 
-    print()
+    out.line()
 
     # Resumen
     if all_files_exist and all_imports_work:
-        print("🎉 ¡TODAS LAS VERIFICACIONES PASARON!")
-        print("🚀 Ejecuta: python main.py")
+        out.line("🎉 ¡TODAS LAS VERIFICACIONES PASARON!")
+        out.line("🚀 Ejecuta: python main.py")
     else:
-        print("❌ ALGUNAS VERIFICACIONES FALLARON")
-        print()
-        print("💡 SOLUCIONES SUGERIDAS:")
+        out.line("❌ ALGUNAS VERIFICACIONES FALLARON")
+        out.line()
+        out.line("💡 SOLUCIONES SUGERIDAS:")
         if not all_files_exist:
-            print(
+            out.line(
                 "  • Asegúrate de que todos los archivos .py estén en sus directorios"
             )
-            print("  • Verifica que los nombres de archivo sean correctos")
+            out.line("  • Verifica que los nombres de archivo sean correctos")
         if not all_imports_work:
-            print("  • Instala dependencias faltantes: pip install PySide6")
-            print("  • Revisa errores de sintaxis en los archivos Python")
-            print("  • Verifica que los imports en los archivos sean correctos")
+            out.line("  • Instala dependencias faltantes: pip install PySide6")
+            out.line("  • Revisa errores de sintaxis en los archivos Python")
+            out.line("  • Verifica que los imports en los archivos sean correctos")
 
+    out.flush()
     return 0 if (all_files_exist and all_imports_work) else 1
 
 
@@ -1,61 +1,141 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import importlib.util
 import os
 import sys
-import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Final
 
 # Agregar el directorio actual al path para imports
-current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir))
+_CUR_STR = os.fspath(Path(__file__).resolve().parent)
+current_dir = Path(_CUR_STR)
+sys.path.insert(0, _CUR_STR)
+
+# Módulos críticos y los nombres que se usan de cada uno
+IMPORTS_TO_CHECK: Final = (
+    ("PySide6.QtWidgets", "QApplication, QMessageBox"),
+    ("PySide6.QtCore", "QTimer, QObject, QThread"),
+    ("utils.logger", "get_logger, setup_logging"),
+    ("utils.constants", "PROJECT_DIR, LOGS_DIR, TEMP_DIR, MODELS_DIR"),
+    ("core.config_manager", "ConfigManager"),
+    ("core.dependency_checker", "DependencyChecker"),
+    ("core.application", "ArchChanApplication"),
+    ("core.state_manager", "AppStateManager"),
+    ("services.ollama_client", "OllamaClient"),
+    ("services.system_monitor", "SystemMonitor"),
+    ("psutil", "psutil"),
+)
+
+
+def detect_qt_platform(environ):
+    """Retorna la plataforma Qt adecuada para la sesión (Wayland o X11)"""
+    # En Wayland, Qt recurre a xcb por sí solo si el plugin no está disponible
+    return "wayland;xcb" if "WAYLAND_DISPLAY" in environ else "xcb"
 
 
 def setup_environment():
     """Configura el entorno de la aplicación"""
     # Establecer directorio de trabajo
-    os.chdir(current_dir)
+    os.chdir(_CUR_STR)
 
-    # Configurar variables de entorno para Qt
-    os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
-    os.environ["QT_SCALE_FACTOR"] = "1"
+    # Configurar variables de entorno para Qt (respetando las del usuario)
+    os.environ.setdefault("QT_AUTO_SCREEN_SCALE_FACTOR", "1")
+    os.environ.setdefault("QT_SCALE_FACTOR", "1")
 
     # Mejorar compatibilidad Wayland/X11
-    if "WAYLAND_DISPLAY" in os.environ:
-        os.environ["QT_QPA_PLATFORM"] = "wayland"
-    else:
-        os.environ["QT_QPA_PLATFORM"] = "xcb"
+    if "QT_QPA_PLATFORM" not in os.environ:
+        os.environ["QT_QPA_PLATFORM"] = detect_qt_platform(os.environ)
+
+
+def make_excepthook(logger, get_application):
+    """Crea el manejador de excepciones no capturadas
+
+    Args:
+        logger: Logger donde registrar la excepción
+        get_application: Retorna la aplicación a apagar (o None si no existe)
+    """
+
+    def handle_exception(exc_type, exc_value, exc_traceback):
+        """Maneja excepciones no capturadas"""
+        if issubclass(exc_type, KeyboardInterrupt):
+            # Ignorar KeyboardInterrupt para permitir cierre normal
+            sys.__excepthook__(exc_type, exc_value, exc_traceback)
+            return
+
+        logger.critical(
+            "Excepción no capturada:", exc_info=(exc_type, exc_value, exc_traceback)
+        )
+
+        # Mostrar diálogo de error
+        from PySide6.QtWidgets import QMessageBox
+
+        error_msg = f"{exc_type.__name__}: {exc_value}"
+        QMessageBox.critical(
+            None,
+            "Error Crítico",
+            f"Se produjo un error crítico:\n\n{error_msg}\n\n"
+            "La aplicación se cerrará.",
+        )
+        # Intentar apagar la aplicación de forma ordenada
+        application = get_application()
+        if application is not None and hasattr(application, "shutdown"):
+            application.shutdown()
+
+    return handle_exception
+
+
+def _module_available(module):
+    """Comprueba que un módulo se puede importar sin ejecutarlo
+
+    Con ARCHCHAN_EAGER_IMPORT=1 el módulo se importa de verdad (útil en CI para
+    detectar errores en el propio módulo, no solo su ausencia).
+    """
+    if os.environ.get("ARCHCHAN_EAGER_IMPORT") == "1":
+        __import__(module)
+        return True
+    if importlib.util.find_spec(module) is None:
+        raise ImportError(f"No module named '{module}'")
+    return True
+
+
+def _try_import(module):
+    """Retorna (módulo, error) sin lanzar ImportError"""
+    try:
+        _module_available(module)
+        return module, None
+    except ImportError as e:
+        return module, e
 
 
-def verify_imports():
+def verify_imports(serial=False):
     """Verifica que todos los imports críticos funcionen"""
     print("📦 Verificando imports críticos...")
 
-    imports_to_check = [
-        ("PySide6.QtWidgets", "QApplication, QMessageBox"),
-        ("PySide6.QtCore", "QTimer, QObject, QThread"),
-        ("utils.logger", "get_logger, setup_logging"),
-        ("utils.constants", "PROJECT_DIR, LOGS_DIR, TEMP_DIR, MODELS_DIR"),
-        ("utils.file_utils", "FileUtils"),
-        ("core.config_manager", "ConfigManager"),
-        ("core.dependency_checker", "DependencyChecker"),
-        ("core.application", "ArchChanApplication"),
-        ("core.state_manager", "AppStateManager"),
-        ("services.ollama_client", "OllamaClient"),
-        ("services.system_monitor", "SystemMonitor"),
-        ("psutil", "psutil"),
-    ]
-
-    for module, imports in imports_to_check:
-        try:
-            __import__(module)
-            print(f"✅ {module} importado correctamente")
-        except ImportError as e:
-            print(f"❌ Error importando {module}: {e}")
-            return False
+    modules = [module for module, _imports in IMPORTS_TO_CHECK]
+    if serial:
+        results = map(_try_import, modules)
+    else:
+        # Las búsquedas son independientes: se solapan en hilos y el
+        # resultado se imprime en el orden original
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(_try_import, modules))
+
+    # Se acumulan las líneas y se escriben de una vez
+    lines = []
+    ok = True
+    for module, error in results:
+        if error is not None:
+            lines.append(f"❌ Error importando {module}: {error}")
+            ok = False
+            break
+        lines.append(f"✅ {module} importado correctamente")
+    else:
+        lines.append("✅ Todos los imports críticos funcionan correctamente")
 
-    print("✅ Todos los imports críticos funcionan correctamente")
-    return True
+    print("\n".join(lines))
+    return ok
 
 
 def main():
@@ -67,89 +147,83 @@ def main():
         setup_environment()
         print("✅ Entorno configurado correctamente")
 
-        # Verificar imports
-        if not verify_imports():
+        # Verificar imports (paso de depuración, ARCHCHAN_VERIFY_IMPORTS=1)
+        if os.environ.get("ARCHCHAN_VERIFY_IMPORTS") and not verify_imports(
+            serial="--serial" in sys.argv
+        ):
             return 1
 
         # Configurar logging (usando constantes)
         # Asegurar que los directorios de constantes existen
         from utils.constants import LOGS_DIR, MODELS_DIR, PROJECT_DIR, TEMP_DIR
-        from utils.file_utils import FileUtils
         from utils.logger import get_logger, setup_logging
 
-        # CORRECCIÓN: Convertir a string si son Path objects
-        FileUtils.ensure_directory(str(PROJECT_DIR))
-        FileUtils.ensure_directory(str(LOGS_DIR))
-        FileUtils.ensure_directory(str(TEMP_DIR))
-        FileUtils.ensure_directory(str(MODELS_DIR))
+        for directory in (PROJECT_DIR, LOGS_DIR, TEMP_DIR, MODELS_DIR):
+            try:
+                os.makedirs(directory, exist_ok=True)
+            except OSError as e:
+                print(f"⚠️ No se pudo crear el directorio {directory}: {e}")
 
         logger = setup_logging(log_dir=str(LOGS_DIR))
         logger.info("Logger configurado correctamente")
 
         # Crear aplicación Qt
         from PySide6.QtCore import QTimer
-        from PySide6.QtWidgets import QApplication, QMessageBox
+        from PySide6.QtWidgets import QApplication, QMessageBox, QStyleFactory
 
         logger.info("Creando aplicación Qt...")
-        app = QApplication(sys.argv)
-        app.setApplicationName("Arch-Chan AI Assistant")
-        app.setApplicationVersion("2.1.0")
-        app.setOrganizationName("Arch-Chan")
-        app.setOrganizationDomain("arch-chan.org")
-
-        # Establecer estilo de aplicación
-        app.setStyle("Fusion")
-
-        # Crear y mostrar aplicación principal
-        logger.info("Creando aplicación principal...")
-        try:
-            from core.application import ArchChanApplication
-
-            application = ArchChanApplication()
-
-            # Conectar señal de shutdown
-            application.app_shutdown.connect(app.quit)
-
-            # Iniciar aplicación con timer para asegurar que el event loop esté corriendo
-            QTimer.singleShot(0, application.start)
-
-            logger.info("Aplicación Arch-Chan v2.1.0 iniciada correctamente")
-
-        except Exception as e:
-            logger.error(f"Error iniciando aplicación: {e}", exc_info=True)
-            QMessageBox.critical(
-                None,
-                "Error Inicial",
-                f"No se pudo iniciar la aplicación:\n\n{str(e)}\n\n"
-                "Revisa la consola para más detalles.",
-            )
-            return 1
+        # Reutilizar la instancia si main() se ejecuta de nuevo en el proceso
+        app = QApplication.instance() or QApplication(sys.argv)
+        for setter, getter, value in (
+            (app.setApplicationName, app.applicationName, "Arch-Chan AI Assistant"),
+            (app.setApplicationVersion, app.applicationVersion, "2.1.0"),
+            (app.setOrganizationName, app.organizationName, "Arch-Chan"),
+            (app.setOrganizationDomain, app.organizationDomain, "arch-chan.org"),
+        ):
+            if getter() != value:
+                setter(value)
+
+        # Establecer estilo de aplicación (ARCHCHAN_STYLE="" mantiene el del sistema)
+        style_name = os.environ.get("ARCHCHAN_STYLE", "Fusion")
+        # Qt toma posesión del estilo: se crea aquí, una vez por proceso
+        style = QStyleFactory.create(style_name) if style_name else None
+        if style is not None:
+            app.setStyle(style)
+
+        # Crear y mostrar aplicación principal ya dentro del loop de eventos,
+        # para que Qt arranque sin esperar a la construcción de la aplicación
+        def _boot():
+            logger.info("Creando aplicación principal...")
+            try:
+                from core.application import ArchChanApplication
+
+                application = ArchChanApplication()
+
+                # Conectar señal de shutdown
+                application.app_shutdown.connect(app.quit)
+
+                # Mantener la referencia mientras dure el loop de eventos
+                app._archchan = application
+                application.start()
+
+                logger.info("Aplicación Arch-Chan v2.1.0 iniciada correctamente")
+
+            except Exception as e:
+                logger.error(f"Error iniciando aplicación: {e}", exc_info=True)
+                QMessageBox.critical(
+                    None,
+                    "Error Inicial",
+                    f"No se pudo iniciar la aplicación:\n\n{str(e)}\n\n"
+                    "Revisa la consola para más detalles.",
+                )
+                app.exit(1)
+
+        QTimer.singleShot(0, _boot)
 
         # Configurar manejo de excepciones no capturadas
-        def handle_exception(exc_type, exc_value, exc_traceback):
-            """Maneja excepciones no capturadas"""
-            if issubclass(exc_type, KeyboardInterrupt):
-                # Ignorar KeyboardInterrupt para permitir cierre normal
-                sys.__excepthook__(exc_type, exc_value, exc_traceback)
-                return
-
-            logger.critical(
-                "Excepción no capturada:", exc_info=(exc_type, exc_value, exc_traceback)
-            )
-
-            # Mostrar diálogo de error
-            error_msg = f"{exc_type.__name__}: {exc_value}"
-            QMessageBox.critical(
-                None,
-                "Error Crítico",
-                f"Se produjo un error crítico:\n\n{error_msg}\n\n"
-                "La aplicación se cerrará.",
-            )
-            # Intentar apagar la aplicación de forma ordenada
-            if "application" in locals() and hasattr(application, "shutdown"):
-                application.shutdown()
-
-        sys.excepthook = handle_exception
+        sys.excepthook = make_excepthook(
+            logger, lambda: getattr(app, "_archchan", None)
+        )
 
         # Ejecutar loop principal
         logger.info("Ejecutando loop principal de Qt...")
@@ -160,6 +234,8 @@ def main():
 
     except Exception as e:
         print(f"❌ Error crítico en main(): {e}")
+        import traceback
+
         traceback.print_exc()
 
         # Intentar mostrar diálogo de error si Qt está disponible
@@ -184,9 +260,11 @@ def main():
 
 
 if __name__ == "__main__":
-    print("🎯 Iniciando Arch-Chan AI Assistant...")
-    print(f"📁 Directorio: {Path(__file__).parent}")
-    print(f"🐍 Python: {sys.version}")
+    sys.stdout.write(
+        "🎯 Iniciando Arch-Chan AI Assistant...\n"
+        f"📁 Directorio: {current_dir}\n"
+        f"🐍 Python: {sys.version}\n"
+    )
 
     exit_code = main()
     print(f"🔚 Saliendo con código: {exit_code}")
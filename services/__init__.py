@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Servicios de la aplicación.
+
+Las clases públicas se importan bajo demanda: ``import services`` no carga
+ningún servicio (ni Qt, requests o psutil) hasta que se accede a ellas.
+"""
+
+import importlib
+
+# Nombre público -> submódulo que lo define
+_LAZY_ATTRS = {
+    "CommandExecutor": ".command_executor",
+    "OllamaClient": ".ollama_client",
+    "SpeechService": ".speech_service",
+    "SystemMonitor": ".system_monitor",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -12,6 +12,41 @@ from PySide6.QtCore import QThread, Signal
 
 from utils.logger import get_logger
 
+# Campos numéricos y variación mínima que se notifica: puntos porcentuales,
+# grados para cpu_temp y KB/s para las tasas de red
+COALESCE_TOLERANCES = {
+    "cpu_percent": 1.0,
+    "memory_percent": 1.0,
+    "swap_percent": 1.0,
+    "disk_percent": 1.0,
+    "cpu_temp": 1.0,
+    "network_sent": 1.0,
+    "network_recv": 1.0,
+}
+
+# Campos que se notifican ante cualquier cambio
+EXACT_FIELDS = ("ollama_running",)
+
+
+def changed_enough(current: Dict, previous: Optional[Dict]) -> bool:
+    """Indica si current difiere de previous lo suficiente para notificarlo"""
+    if previous is None:
+        return True
+
+    for field in EXACT_FIELDS:
+        if current.get(field) != previous.get(field):
+            return True
+
+    for field, tolerance in COALESCE_TOLERANCES.items():
+        new_value, old_value = current.get(field), previous.get(field)
+        if new_value is None or old_value is None:
+            if new_value is not old_value:
+                return True
+        elif abs(new_value - old_value) >= tolerance:
+            return True
+
+    return False
+
 
 class SystemMonitor(QThread):
     """Servicio de monitoreo del sistema en tiempo real"""
@@ -44,6 +79,9 @@ class SystemMonitor(QThread):
         # Historial para cálculos de red
         self.network_history = []
 
+        # Última información emitida por system_updated
+        self._last_emitted: Optional[Dict] = None
+
         # Cliente Ollama
         self.ollama_client = None
 
@@ -57,11 +95,16 @@ class SystemMonitor(QThread):
         # Inicializar datos de red
         self.previous_net_io = psutil.net_io_counters()
 
+        # Primera lectura de CPU: las siguientes miden desde la anterior
+        psutil.cpu_percent(interval=None)
+
         while self.running:
             try:
                 system_info = self._collect_system_data()
                 if system_info:
-                    self.system_updated.emit(system_info)
+                    if changed_enough(system_info, self._last_emitted):
+                        self._last_emitted = system_info
+                        self.system_updated.emit(system_info)
 
                     # Verificar advertencias
                     self._check_warnings(system_info)
@@ -80,8 +123,8 @@ class SystemMonitor(QThread):
     def _collect_system_data(self) -> Optional[Dict]:
         """Recolecta datos del sistema"""
         try:
-            # CPU
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            # CPU (sin bloquear: uso medio desde la lectura anterior)
+            cpu_percent = psutil.cpu_percent(interval=None)
 
             # Memoria
             memory = psutil.virtual_memory()
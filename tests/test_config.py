@@ -0,0 +1,18 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Pruebas del parser INI de config.py"""
+
+from config import _parse_ini
+
+
+def test_parse_ini_acepta_dos_puntos_como_separador():
+    data = b"[UI]\ntheme: monokai\nfont_size = 12\n"
+    assert _parse_ini(data) == {"UI": {"theme": "monokai", "font_size": "12"}}
+
+
+def test_parse_ini_separa_por_el_primer_delimitador():
+    data = b"[Advanced]\nproxy = http://localhost:8080\nextra: a=b\n"
+    assert _parse_ini(data) == {
+        "Advanced": {"proxy": "http://localhost:8080", "extra": "a=b"}
+    }
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Pruebas de la lectura de config.ini en ConfigManager"""
+
+import configparser
+
+from core.config_manager import ConfigManager
+
+
+def _manager(tmp_path, content):
+    config_file = tmp_path / "config.ini"
+    config_file.write_text(content, encoding="utf-8")
+    manager = ConfigManager(str(config_file))
+    manager.load_config()
+    return manager
+
+
+def test_lineas_de_continuacion_como_configparser(tmp_path):
+    content = "[General]\nmodel = arch-chan\n  linea dos\n\n\tlinea tres\n"
+    manager = _manager(tmp_path, content)
+
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read_string(content)
+    assert manager.get("General", "model") == parser.get("General", "model")
+
+    # Al guardar se sangran de nuevo: el archivo sigue siendo válido
+    parser.read_string(manager._serialize())
+    assert parser.get("General", "model") == "arch-chan\nlinea dos\n\nlinea tres"
+
+
+def test_default_se_hereda_en_las_secciones(tmp_path):
+    content = "[DEFAULT]\nfont_size = 14\n\n[UI]\ntheme = arch-dark\n"
+    manager = _manager(tmp_path, content)
+
+    assert manager.getint("UI", "font_size") == 14
+    # La validación no sustituye el valor heredado por el de fábrica
+    assert "font_size" not in manager._data["UI"]
+    settings = manager.get_all_settings()
+    assert "DEFAULT" not in settings
+    assert settings["UI"]["font_size"] == "14"
+
+    manager.set("DEFAULT", "font_size", 16)
+    assert manager.getint("UI", "font_size") == 16
+
+
+def test_archivo_ilegible_no_se_sobrescribe(tmp_path):
+    content = "opción sin sección = 1\n"
+    manager = _manager(tmp_path, content)
+
+    assert manager.get("General", "model") == "arch-chan"
+    assert manager.save_config()
+    assert (tmp_path / "config.ini").read_text(encoding="utf-8") == content
+
+
+def test_configparser_como_respaldo_de_la_lectura_rapida(tmp_path, monkeypatch):
+    def fallar(self, path):
+        raise ValueError("sintaxis no soportada")
+
+    monkeypatch.setattr(ConfigManager, "_fast_read", fallar)
+    content = "[DEFAULT]\nlanguage = en\n\n[UI]\ntheme = monokai\n"
+    manager = _manager(tmp_path, content)
+
+    assert manager.get("UI", "theme") == "monokai"
+    assert manager.get("General", "language") == "en"
+    assert manager._data["DEFAULT"] == {"language": "en"}
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Pruebas del historial y de los slots de AppStateManager"""
+
+import struct
+import sys
+
+import pytest
+
+pytest.importorskip("PySide6.QtCore")
+
+from core.state_manager import AppState, AppStateManager  # noqa: E402
+
+
+@pytest.fixture
+def manager():
+    manager = AppStateManager()
+    for state in (AppState.IDLE, AppState.LISTENING, AppState.IDLE):
+        manager.set_state(state)
+    return manager
+
+
+@pytest.mark.parametrize("limit", [0, 1, 2, 3, 10, -1, -5])
+def test_get_state_history_equivale_al_slice(manager, limit):
+    expected = list(manager._state_history)[-limit:]
+    assert manager.get_state_history(limit) == expected
+
+
+def test_get_state_history_limit_cero_retorna_todo(manager):
+    assert len(manager.get_state_history(0)) == 3
+
+
+def test_senales_con_slots(manager):
+    recibidos = []
+    manager.state_changed.connect(lambda old, new: recibidos.append((old, new)))
+    manager.status_message.connect(recibidos.append)
+
+    # set_<estado> se resuelve con __getattr__ aunque la clase use __slots__
+    assert manager.set_listening("prueba")
+    manager.set_status_message("Escuchando")
+
+    assert recibidos == [(AppState.IDLE, AppState.LISTENING), "Escuchando"]
+    assert manager.get_state_history(1)[0]["reason"] == "prueba"
+
+
+def test_slots_reducen_el_tamano_de_la_instancia(manager):
+    slots = AppStateManager.__slots__
+    atributos = vars(manager)
+    # QObject (Shiboken) conserva su __dict__, pero solo para las señales
+    assert not atributos.keys() & set(slots)
+
+    # Sin __slots__, esos atributos irían al __dict__ y la instancia no
+    # reservaría un puntero por slot
+    sin_slots = dict(atributos)
+    sin_slots.update((name, getattr(manager, name)) for name in slots)
+    con_slots = sys.getsizeof(manager) + sys.getsizeof(atributos)
+    pointer = struct.calcsize("P")
+    estimado = sys.getsizeof(manager) - pointer * len(slots) + sys.getsizeof(sin_slots)
+    assert con_slots < estimado
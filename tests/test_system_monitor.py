@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Pruebas de la agrupación de notificaciones de SystemMonitor"""
+
+import pytest
+
+pytest.importorskip("psutil")
+pytest.importorskip("requests")
+pytest.importorskip("PySide6.QtCore")
+
+from services.system_monitor import changed_enough  # noqa: E402
+
+BASE = {
+    "cpu_percent": 10.0,
+    "memory_percent": 50.0,
+    "swap_percent": 0.0,
+    "disk_percent": 40.0,
+    "cpu_temp": None,
+    "network_sent": 3.21,
+    "network_recv": 12.5,
+    "ollama_running": True,
+}
+
+
+def test_primera_lectura_se_notifica():
+    assert changed_enough(BASE, None)
+
+
+def test_variacion_pequena_de_red_no_se_notifica():
+    jitter = {**BASE, "network_sent": 3.87, "network_recv": 12.03}
+    assert not changed_enough(jitter, BASE)
+
+
+def test_variacion_de_red_por_encima_de_la_tolerancia_se_notifica():
+    assert changed_enough({**BASE, "network_recv": 14.0}, BASE)
+
+
+def test_variacion_de_cpu_bajo_la_tolerancia_no_se_notifica():
+    assert not changed_enough({**BASE, "cpu_percent": 10.6}, BASE)
+
+
+def test_cambio_de_estado_de_ollama_se_notifica():
+    assert changed_enough({**BASE, "ollama_running": False}, BASE)
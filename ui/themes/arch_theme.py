@@ -6,8 +6,9 @@ Sistema de temas completamente reescrito para Arch-Chan v2.1
 Incluye 10 temas diferentes con animaciones CSS3 y efectos visuales
 """
 
+import functools
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 
 class ArchLinuxTheme:
@@ -329,6 +330,9 @@ class ArchLinuxTheme:
         },
     }
 
+    # Nombres de los temas, calculados una sola vez
+    AVAILABLE_THEMES = tuple(THEMES)
+
     # Configuración de fuentes
     FONTS = {
         "primary": "'Noto Sans', 'DejaVu Sans', sans-serif",
@@ -343,9 +347,9 @@ class ArchLinuxTheme:
         return cls.THEMES.get(theme_name, cls.THEMES["arch-dark"])
 
     @classmethod
-    def get_available_themes(cls) -> List[str]:
+    def get_available_themes(cls) -> Tuple[str, ...]:
         """Retorna la lista de todos los temas disponibles"""
-        return list(cls.THEMES.keys())
+        return cls.AVAILABLE_THEMES
 
     @classmethod
     def get_theme_names(cls) -> List[str]:
@@ -355,17 +359,89 @@ class ArchLinuxTheme:
     @classmethod
     def get_stylesheet(cls, theme_name: str) -> str:
         """Genera la hoja de estilo completa para el tema especificado"""
+        # Los nombres desconocidos comparten la entrada del tema por defecto
+        if theme_name not in cls.THEMES:
+            theme_name = "arch-dark"
+        return cls._build_stylesheet(theme_name)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)  # Acotada por el número de temas
+    def _build_stylesheet(cls, theme_name: str) -> str:
+        """Construye la hoja de estilo de un tema (una sola vez por tema)"""
+        theme = cls.get_theme(theme_name)
+
+        return _STYLESHEET_TEMPLATE.format_map(
+            {
+                **theme,
+                "name_upper": theme["name"].upper(),
+                "fonts_primary": cls.FONTS["primary"],
+            }
+        )
+
+    @classmethod
+    def get_theme_preview_html(cls, theme_name: str) -> str:
+        """Genera HTML de vista previa para el tema"""
         theme = cls.get_theme(theme_name)
 
         return f"""
-            /* === ARCH LINUX THEME - {theme['name'].upper()} === */
+        <div style="font-family: 'Noto Sans', sans-serif; padding: 20px; 
+                    background: {theme['background']}; color: {theme['text_primary']}; 
+                    border-radius: 12px; border: 2px solid {theme['border_light']};">
+            <h3 style="color: {theme['primary']}; margin-bottom: 15px;">
+                🎨 {theme['name']} Theme
+            </h3>
+            <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 10px; margin-bottom: 15px;">
+                <div style="background: {theme['surface']}; padding: 10px; border-radius: 6px; border: 1px solid {theme['border_light']};">
+                    Surface
+                </div>
+                <div style="background: {theme['primary']}; color: white; padding: 10px; border-radius: 6px;">
+                    Primary
+                </div>
+                <div style="background: {theme['accent']}; padding: 10px; border-radius: 6px;">
+                    Accent
+                </div>
+                <div style="background: {theme['success']}; padding: 10px; border-radius: 6px;">
+                    Success
+                </div>
+            </div>
+            <div style="font-size: 12px; color: {theme['text_secondary']};">
+                Tipo: {theme['type'].title()} • Colores: {len(theme)}
+            </div>
+        </div>
+        """
+
+    @classmethod
+    def export_theme(cls, theme_name: str, filepath: str) -> bool:
+        """Exporta un tema a archivo JSON"""
+        try:
+            theme = cls.get_theme(theme_name)
+            with open(filepath, "w", encoding="utf-8") as f:
+                json.dump(theme, f, indent=2, ensure_ascii=False)
+            return True
+        except Exception:
+            return False
+
+    @classmethod
+    def import_theme(cls, filepath: str) -> Dict[str, Any]:
+        """Importa un tema desde archivo JSON"""
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+
+# Plantilla de la hoja de estilo: se analiza una vez al importar el módulo y
+# ArchLinuxTheme._build_stylesheet la rellena con los colores de cada tema
+_STYLESHEET_TEMPLATE = """
+            /* === ARCH LINUX THEME - {name_upper} === */
             /* Generado automáticamente para Arch-Chan v2.1 */
 
             /* === ESTILOS BASE === */
             QMainWindow, QWidget {{
-                background-color: {theme['background']};
-                color: {theme['text_primary']};
-                font-family: {cls.FONTS['primary']};
+                background-color: {background};
+                color: {text_primary};
+                font-family: {fonts_primary};
                 font-size: 11px;
                 border: none;
                 outline: none;
@@ -373,30 +449,30 @@ class ArchLinuxTheme:
 
             /* === VENTANA PRINCIPAL === */
             #main_central_widget {{
-                background: {theme['gradient_surface']};
-                border: 1px solid {theme['border']};
+                background: {gradient_surface};
+                border: 1px solid {border};
                 border-radius: 12px;
             }}
 
             /* === BARRA DE HERRAMIENTAS === */
             QToolBar {{
-                background: {theme['gradient_surface']};
-                border-bottom: 1px solid {theme['border_light']};
+                background: {gradient_surface};
+                border-bottom: 1px solid {border_light};
                 spacing: 6px;
                 padding: 4px;
             }}
 
             QToolBar::separator {{
-                background: {theme['border_light']};
+                background: {border_light};
                 width: 1px;
                 margin: 4px 2px;
             }}
 
             /* === BOTONES PRINCIPALES === */
             QPushButton {{
-                background: {theme['gradient_primary']};
+                background: {gradient_primary};
                 color: white;
-                border: 1px solid {theme['primary_dark']};
+                border: 1px solid {primary_dark};
                 border-radius: 8px;
                 padding: 8px 16px;
                 font-weight: bold;
@@ -406,28 +482,28 @@ class ArchLinuxTheme:
 
             QPushButton:hover {{
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['primary_light']}, stop:1 {theme['primary']});
-                border: 1px solid {theme['primary_light']};
+                    stop:0 {primary_light}, stop:1 {primary});
+                border: 1px solid {primary_light};
                 transform: translateY(-1px);
             }}
 
             QPushButton:pressed {{
-                background: {theme['primary_dark']};
+                background: {primary_dark};
                 transform: translateY(1px);
             }}
 
             QPushButton:disabled {{
-                background: {theme['surface']};
-                color: {theme['text_muted']};
-                border: 1px solid {theme['border']};
+                background: {surface};
+                color: {text_muted};
+                border: 1px solid {border};
             }}
 
             /* === BOTÓN DE VOZ === */
             #voice_button {{
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['accent']}, stop:1 {theme['primary']});
+                    stop:0 {accent}, stop:1 {primary});
                 color: white;
-                border: 1px solid {theme['primary_dark']};
+                border: 1px solid {primary_dark};
                 border-radius: 8px;
                 font-weight: bold;
                 min-width: 80px;
@@ -436,21 +512,21 @@ class ArchLinuxTheme:
 
             #voice_button:hover {{
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['success']}, stop:1 {theme['accent']});
+                    stop:0 {success}, stop:1 {accent});
             }}
 
             #voice_button.recording {{
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['error']}, stop:1 {theme['warning']});
+                    stop:0 {error}, stop:1 {warning});
                 animation: pulse 2s infinite;
             }}
 
             /* === BOTÓN DE ENVIAR === */
             #send_button {{
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['success']}, stop:1 {theme['accent']});
+                    stop:0 {success}, stop:1 {accent});
                 color: white;
-                border: 1px solid {theme['primary_dark']};
+                border: 1px solid {primary_dark};
                 border-radius: 8px;
                 font-weight: bold;
                 min-width: 80px;
@@ -459,15 +535,15 @@ class ArchLinuxTheme:
 
             #send_button:hover {{
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #45E685, stop:1 {theme['success']});
+                    stop:0 #45E685, stop:1 {success});
             }}
 
             /* === BOTÓN DE DETENER === */
             #stop_button {{
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['error']}, stop:1 {theme['warning']});
+                    stop:0 {error}, stop:1 {warning});
                 color: white;
-                border: 1px solid {theme['border']};
+                border: 1px solid {border};
                 border-radius: 8px;
                 font-weight: bold;
                 font-size: 12px;
@@ -475,92 +551,92 @@ class ArchLinuxTheme:
 
             #stop_button:hover {{
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #FF6B6B, stop:1 {theme['error']});
+                    stop:0 #FF6B6B, stop:1 {error});
             }}
 
             /* === CAMPO DE TEXTO === */
             #text_input {{
-                background-color: {theme['surface']};
-                color: {theme['text_primary']};
-                border: 1px solid {theme['border_light']};
+                background-color: {surface};
+                color: {text_primary};
+                border: 1px solid {border_light};
                 border-radius: 8px;
                 padding: 10px 14px;
-                font-family: {cls.FONTS['primary']};
+                font-family: {fonts_primary};
                 font-size: 11px;
-                selection-background-color: {theme['selection']};
+                selection-background-color: {selection};
             }}
 
             #text_input:focus {{
-                border: 2px solid {theme['primary']};
-                background-color: {theme['surface_light']};
+                border: 2px solid {primary};
+                background-color: {surface_light};
             }}
 
             #text_input:placeholder {{
-                color: {theme['text_muted']};
+                color: {text_muted};
                 font-style: italic;
             }}
 
             /* === ÁREA DE CHAT === */
             #chat_area {{
-                background-color: {theme['background']};
+                background-color: {background};
                 border: none;
                 border-radius: 0px;
-                font-family: {cls.FONTS['primary']};
+                font-family: {fonts_primary};
                 font-size: 11px;
-                color: {theme['text_primary']};
+                color: {text_primary};
                 padding: 12px;
-                selection-background-color: {theme['selection']};
+                selection-background-color: {selection};
                 line-height: 1.4;
             }}
 
             #chat_area QScrollBar:vertical {{
-                background-color: {theme['surface']};
+                background-color: {surface};
                 width: 14px;
                 margin: 0px;
                 border-radius: 7px;
             }}
 
             #chat_area QScrollBar::handle:vertical {{
-                background-color: {theme['border_light']};
+                background-color: {border_light};
                 border-radius: 7px;
                 min-height: 30px;
             }}
 
             #chat_area QScrollBar::handle:vertical:hover {{
-                background-color: {theme['primary_light']};
+                background-color: {primary_light};
             }}
 
             /* === PANEL LATERAL === */
             #system_info_frame {{
-                background-color: {theme['surface']};
-                border: 1px solid {theme['border_light']};
+                background-color: {surface};
+                border: 1px solid {border_light};
                 border-radius: 12px;
                 padding: 16px;
             }}
 
             /* === BARRA DE ESTADO === */
             QStatusBar {{
-                background-color: {theme['surface']};
-                color: {theme['text_primary']};
-                border-top: 1px solid {theme['border_light']};
+                background-color: {surface};
+                color: {text_primary};
+                border-top: 1px solid {border_light};
                 font-size: 10px;
             }}
 
             /* === SELECTOR DE MODELO === */
             #model_selector {{
-                background-color: {theme['surface_light']};
-                color: {theme['text_primary']};
-                border: 1px solid {theme['border_light']};
+                background-color: {surface_light};
+                color: {text_primary};
+                border: 1px solid {border_light};
                 border-radius: 8px;
                 padding: 6px 12px;
                 min-width: 140px;
                 font-size: 10px;
-                selection-background-color: {theme['selection']};
+                selection-background-color: {selection};
             }}
 
             #model_selector:hover {{
-                border: 1px solid {theme['primary_light']};
-                background-color: {theme['hover']};
+                border: 1px solid {primary_light};
+                background-color: {hover};
             }}
 
             #model_selector::drop-down {{
@@ -572,16 +648,16 @@ class ArchLinuxTheme:
                 image: none;
                 border-left: 4px solid transparent;
                 border-right: 4px solid transparent;
-                border-top: 4px solid {theme['text_secondary']};
+                border-top: 4px solid {text_secondary};
                 width: 0px;
                 height: 0px;
             }}
 
             #model_selector QAbstractItemView {{
-                background-color: {theme['surface']};
-                border: 1px solid {theme['border_light']};
-                color: {theme['text_primary']};
-                selection-background-color: {theme['primary']};
+                background-color: {surface};
+                border: 1px solid {border_light};
+                color: {text_primary};
+                selection-background-color: {primary};
                 selection-color: white;
                 outline: none;
                 border-radius: 6px;
@@ -589,15 +665,15 @@ class ArchLinuxTheme:
 
             /* === BARRAS DE PROGRESO === */
             QProgressBar {{
-                border: 1px solid {theme['border_light']};
+                border: 1px solid {border_light};
                 border-radius: 6px;
-                background-color: {theme['surface']};
+                background-color: {surface};
                 text-align: center;
                 height: 8px;
             }}
 
             QProgressBar::chunk {{
-                background: {theme['gradient_primary']};
+                background: {gradient_primary};
                 border-radius: 4px;
             }}
 
@@ -609,9 +685,9 @@ class ArchLinuxTheme:
             }}
 
             @keyframes glow {{
-                0% {{ box-shadow: 0 0 5px {theme['primary']}; }}
-                50% {{ box-shadow: 0 0 20px {theme['primary']}, 0 0 30px {theme['accent']}; }}
-                100% {{ box-shadow: 0 0 5px {theme['primary']}; }}
+                0% {{ box-shadow: 0 0 5px {primary}; }}
+                50% {{ box-shadow: 0 0 20px {primary}, 0 0 30px {accent}; }}
+                100% {{ box-shadow: 0 0 5px {primary}; }}
             }}
 
             @keyframes slideIn {{
@@ -630,30 +706,30 @@ class ArchLinuxTheme:
 
             .processing {{
                 animation: pulse 1s infinite;
-                color: {theme['accent']};
+                color: {accent};
             }}
 
             .warning {{
-                color: {theme['warning']};
+                color: {warning};
                 font-weight: bold;
             }}
 
             .error {{
-                color: {theme['error']};
+                color: {error};
                 font-weight: bold;
                 animation: pulse 0.5s infinite;
             }}
 
             .success {{
-                color: {theme['success']};
+                color: {success};
                 font-weight: bold;
             }}
 
             /* === TOOLTIPS === */
             QToolTip {{
-                background-color: {theme['surface']};
-                color: {theme['text_primary']};
-                border: 1px solid {theme['border_light']};
+                background-color: {surface};
+                color: {text_primary};
+                border: 1px solid {border_light};
                 border-radius: 6px;
                 padding: 8px 12px;
                 font-size: 10px;
@@ -662,8 +738,8 @@ class ArchLinuxTheme:
 
             /* === MENÚS DESPLEGABLES === */
             QMenu {{
-                background-color: {theme['surface']};
-                border: 1px solid {theme['border_light']};
+                background-color: {surface};
+                border: 1px solid {border_light};
                 border-radius: 8px;
                 padding: 4px;
             }}
@@ -675,71 +751,71 @@ class ArchLinuxTheme:
             }}
 
             QMenu::item:selected {{
-                background-color: {theme['selection']};
+                background-color: {selection};
             }}
 
             QMenu::separator {{
                 height: 1px;
-                background: {theme['border_light']};
+                background: {border_light};
                 margin: 4px 8px;
             }}
 
             /* === CHECKBOXES Y RADIO BUTTONS === */
             QCheckBox, QRadioButton {{
                 spacing: 8px;
-                color: {theme['text_primary']};
+                color: {text_primary};
             }}
 
             QCheckBox::indicator, QRadioButton::indicator {{
                 width: 16px;
                 height: 16px;
-                border: 1px solid {theme['border_light']};
+                border: 1px solid {border_light};
                 border-radius: 3px;
-                background: {theme['surface_light']};
+                background: {surface_light};
             }}
 
             QCheckBox::indicator:checked, QRadioButton::indicator:checked {{
-                background: {theme['primary']};
-                border: 1px solid {theme['primary_dark']};
+                background: {primary};
+                border: 1px solid {primary_dark};
             }}
 
             QCheckBox::indicator:hover, QRadioButton::indicator:hover {{
-                border: 1px solid {theme['primary_light']};
+                border: 1px solid {primary_light};
             }}
 
             /* === GROUP BOXES === */
             QGroupBox {{
                 font-weight: bold;
-                border: 1px solid {theme['border_light']};
+                border: 1px solid {border_light};
                 border-radius: 8px;
                 margin-top: 12px;
                 padding-top: 12px;
-                color: {theme['text_primary']};
+                color: {text_primary};
             }}
 
             QGroupBox::title {{
                 subcontrol-origin: margin;
                 left: 12px;
                 padding: 0 8px 0 8px;
-                color: {theme['primary']};
+                color: {primary};
             }}
 
             /* === SCROLLBARS MEJORADAS === */
             QScrollBar:vertical {{
-                background-color: {theme['surface']};
+                background-color: {surface};
                 width: 12px;
                 margin: 0px;
                 border-radius: 6px;
             }}
 
             QScrollBar::handle:vertical {{
-                background-color: {theme['border_light']};
+                background-color: {border_light};
                 border-radius: 6px;
                 min-height: 20px;
             }}
 
             QScrollBar::handle:vertical:hover {{
-                background-color: {theme['primary_light']};
+                background-color: {primary_light};
             }}
 
             QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
@@ -747,31 +823,31 @@ class ArchLinuxTheme:
             }}
 
             QScrollBar:horizontal {{
-                background-color: {theme['surface']};
+                background-color: {surface};
                 height: 12px;
                 margin: 0px;
                 border-radius: 6px;
             }}
 
             QScrollBar::handle:horizontal {{
-                background-color: {theme['border_light']};
+                background-color: {border_light};
                 border-radius: 6px;
                 min-width: 20px;
             }}
 
             QScrollBar::handle:horizontal:hover {{
-                background-color: {theme['primary_light']};
+                background-color: {primary_light};
             }}
 
             /* === HEADERS Y TÍTULOS === */
             #chat_header {{
-                background: {theme['gradient_surface']};
-                border-bottom: 1px solid {theme['border_light']};
+                background: {gradient_surface};
+                border-bottom: 1px solid {border_light};
                 border-radius: 12px 12px 0 0;
             }}
 
             #chat_title {{
-                color: {theme['text_primary']};
+                color: {text_primary};
                 font-size: 14px;
                 font-weight: bold;
                 background: transparent;
@@ -779,31 +855,31 @@ class ArchLinuxTheme:
 
             /* === ETIQUETAS DE INFORMACIÓN === */
             .info_label {{
-                color: {theme['text_secondary']};
+                color: {text_secondary};
                 font-size: 10px;
                 background: transparent;
                 font-weight: normal;
             }}
 
             .info_value {{
-                color: {theme['text_primary']};
+                color: {text_primary};
                 font-size: 10px;
                 font-weight: bold;
                 background: transparent;
             }}
 
             .info_value_warning {{
-                color: {theme['warning']};
+                color: {warning};
                 font-weight: bold;
             }}
 
             .info_value_error {{
-                color: {theme['error']};
+                color: {error};
                 font-weight: bold;
             }}
 
             .info_value_success {{
-                color: {theme['success']};
+                color: {success};
                 font-weight: bold;
             }}
 
@@ -814,20 +890,20 @@ class ArchLinuxTheme:
 
             /* === ESTILOS PARA DIÁLOGOS === */
             QDialog {{
-                background: {theme['gradient_surface']};
-                border: 1px solid {theme['border_light']};
+                background: {gradient_surface};
+                border: 1px solid {border_light};
                 border-radius: 12px;
             }}
 
             QMessageBox {{
-                background: {theme['gradient_surface']};
-                border: 1px solid {theme['border_light']};
+                background: {gradient_surface};
+                border: 1px solid {border_light};
                 border-radius: 12px;
             }}
 
             /* === MEJORAS DE ACCESIBILIDAD === */
             QWidget:focus {{
-                outline: 2px solid {theme['primary']};
+                outline: 2px solid {primary};
                 outline-offset: 2px;
             }}
 
@@ -835,71 +911,19 @@ class ArchLinuxTheme:
             #close_button, #minimize_button {{
                 background: transparent;
                 border: none;
-                color: {theme['text_secondary']};
+                color: {text_secondary};
                 font-size: 14px;
                 padding: 4px 8px;
                 border-radius: 4px;
             }}
 
             #close_button:hover {{
-                background: {theme['error']};
+                background: {error};
                 color: white;
             }}
 
             #minimize_button:hover {{
-                background: {theme['warning']};
+                background: {warning};
                 color: white;
             }}
         """
-
-    @classmethod
-    def get_theme_preview_html(cls, theme_name: str) -> str:
-        """Genera HTML de vista previa para el tema"""
-        theme = cls.get_theme(theme_name)
-
-        return f"""
-        <div style="font-family: 'Noto Sans', sans-serif; padding: 20px; 
-                    background: {theme['background']}; color: {theme['text_primary']}; 
-                    border-radius: 12px; border: 2px solid {theme['border_light']};">
-            <h3 style="color: {theme['primary']}; margin-bottom: 15px;">
-                🎨 {theme['name']} Theme
-            </h3>
-            <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 10px; margin-bottom: 15px;">
-                <div style="background: {theme['surface']}; padding: 10px; border-radius: 6px; border: 1px solid {theme['border_light']};">
-                    Surface
-                </div>
-                <div style="background: {theme['primary']}; color: white; padding: 10px; border-radius: 6px;">
-                    Primary
-                </div>
-                <div style="background: {theme['accent']}; padding: 10px; border-radius: 6px;">
-                    Accent
-                </div>
-                <div style="background: {theme['success']}; padding: 10px; border-radius: 6px;">
-                    Success
-                </div>
-            </div>
-            <div style="font-size: 12px; color: {theme['text_secondary']};">
-                Tipo: {theme['type'].title()} • Colores: {len(theme)}
-            </div>
-        </div>
-        """
-
-    @classmethod
-    def export_theme(cls, theme_name: str, filepath: str) -> bool:
-        """Exporta un tema a archivo JSON"""
-        try:
-            theme = cls.get_theme(theme_name)
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(theme, f, indent=2, ensure_ascii=False)
-            return True
-        except Exception:
-            return False
-
-    @classmethod
-    def import_theme(cls, filepath: str) -> Dict[str, Any]:
-        """Importa un tema desde archivo JSON"""
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return {}
@@ -6,7 +6,7 @@
 import os
 from pathlib import Path
 
-from config import CONFIGS_PATH
+from config import CONFIGS_PATH, create_project_directories
 
 # Versión de la aplicación
 APP_VERSION = "2.1"
@@ -57,14 +57,4 @@ WHISPER_MODEL = "ggml-base.bin"
 AUDIO_INPUT_FILE = "input.wav"
 
 # Crear directorios si no existen
-for directory in [PROJECT_DIR, MODELS_DIR, TEMP_DIR, LOGS_DIR]:
-    if isinstance(directory, Path):
-        directory.mkdir(parents=True, exist_ok=True)
-    else:
-        # Si es un string, convertirlo a Path
-        Path(directory).expanduser().mkdir(parents=True, exist_ok=True)
-
-# Manejar CONFIGS_PATH por separado si existe
-if "CONFIGS_PATH" in globals():
-    configs_path = Path(CONFIGS_PATH).expanduser()
-    configs_path.mkdir(parents=True, exist_ok=True)
+create_project_directories()